@@ -79,7 +79,11 @@ class AgentRunner:
 				self.agent.eventbus.dispatch(CreateAgentTaskEvent.from_agent(self.agent))
 
 			self.agent.telemetry_handler.log_first_step_startup()
-			await self.agent.browser_session.start()
+			# Warm first-step caches in a worker thread while the browser launches
+			await asyncio.gather(
+				self.agent.browser_session.start(),
+				asyncio.to_thread(self.agent.step_executor.warmup),
+			)
 
 			try:
 				await self.agent.step_executor.execute_initial_actions()
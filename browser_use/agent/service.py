@@ -618,6 +618,10 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 	async def _check_stop_or_pause(self) -> None:
 		"""Check if the agent should stop or pause, and handle accordingly."""
 
+		# ローカルの停止/一時停止フラグを先に確認し、既に止まっていれば外部コールバックを呼ばない
+		if self.state.stopped or self.state.paused:
+			raise InterruptedError
+
 		# should_stop_callback をチェックし、例外を投げずに停止フラグを立てる
 		if self.register_should_stop_callback:
 			if await self.register_should_stop_callback():
@@ -629,12 +633,6 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			if await self.register_external_agent_status_raise_error_callback():
 				raise InterruptedError
 
-		if self.state.stopped:
-			raise InterruptedError
-
-		if self.state.paused:
-			raise InterruptedError
-
 	@observe(name='agent.step', ignore_output=True, ignore_input=True)
 	@time_execution_async('--step')
 	async def step(self, step_info: AgentStepInfo | None = None) -> None:
@@ -4,7 +4,9 @@ import asyncio
 import inspect
 import json
 import logging
+import re
 import time
+from collections.abc import Awaitable
 from typing import TYPE_CHECKING
 
 from browser_use.agent.cloud_events import CreateAgentStepEvent
@@ -19,6 +21,15 @@ if TYPE_CHECKING:
 	from browser_use.agent.service import Agent
 	from browser_use.tools.registry.views import ActionModel
 
+# ANSI colour codes used by the per-action log lines in multi_act
+_ANSI_GREEN = '\033[92m'
+_ANSI_BLUE = '\033[34m'
+_ANSI_RESET = '\033[0m'
+# Characters dropped from the dict repr used as the fallback action log line
+_ACTION_LOG_STRIP_TABLE = str.maketrans('', '', '"{}\'')
+# Errors caused by the model's output format, for which handle_step_error also names the model
+_PARSE_ERROR_RE = re.compile(r'Could not parse response|tool_use_failed')
+
 
 class StepExecutor:
 	"""Coordinate the main control flow of Agent steps."""
@@ -35,51 +46,10 @@ class StepExecutor:
 		browser_state_summary: BrowserStateSummary | None = None
 		try:
 			browser_state_summary = await self.prepare_context(step_info)
+			await self.get_next_action(browser_state_summary)
 
-			while True:
-				await self.get_next_action(browser_state_summary)
-
-				if not agent.settings.interactive_mode:
-					break
-
-				approval = await self.request_human_approval(step_info, browser_state_summary)
-
-				if approval.decision == 'approve':
-					agent.logger.debug('✅ Interactive approval granted - executing actions')
-					break
-
-				if approval.decision == 'retry':
-					if approval.feedback:
-						agent.logger.info('🔁 人間からのフィードバックを受け取り、再度アクション候補を生成します')
-						agent._message_manager._add_context_message(
-							UserMessage(content=f'<human_feedback>{approval.feedback}</human_feedback>')
-						)
-					else:
-						agent.logger.info('🔁 承認されなかったため、フィードバックなしでアクションを再生成します')
-
-					await agent._check_stop_or_pause()
-					continue
-
-				if approval.decision == 'skip':
-					agent.logger.info('⏭️ ユーザーがこのステップのアクション実行をスキップしました（インタラクティブモード）')
-					agent.state.last_result = [
-						ActionResult(
-							extracted_content='User skipped execution during interactive approval.',
-							include_in_memory=True,
-							long_term_memory='User skipped execution during interactive approval.',
-						)
-					]
-					return
-
-				if approval.decision == 'cancel':
-					agent.logger.info('🛑 ユーザーがインタラクティブモードでエージェント実行をキャンセルしました')
-					agent.stop()
-					agent.state.last_result = [
-						ActionResult(
-							error='User cancelled execution during interactive approval.',
-						)
-					]
-					return
+			if agent.settings.interactive_mode and not await self.run_approval_loop(step_info, browser_state_summary):
+				return
 
 			await self.execute_actions()
 			await self.post_process()
@@ -88,6 +58,57 @@ class StepExecutor:
 		finally:
 			await self.finalize(browser_state_summary)
 
+	async def run_approval_loop(
+		self,
+		step_info: AgentStepInfo | None,
+		browser_state_summary: BrowserStateSummary,
+	) -> bool:
+		"""Ask for human approval until the proposed actions are approved, skipped or cancelled.
+
+		Returns True when the actions should be executed.
+		"""
+		agent = self.agent
+		while True:
+			approval = await self.request_human_approval(step_info, browser_state_summary)
+
+			if approval.decision == 'approve':
+				agent.logger.debug('✅ Interactive approval granted - executing actions')
+				return True
+
+			if approval.decision == 'retry':
+				if approval.feedback:
+					agent.logger.info('🔁 人間からのフィードバックを受け取り、再度アクション候補を生成します')
+					agent._message_manager._add_context_message(
+						UserMessage(content=f'<human_feedback>{approval.feedback}</human_feedback>')
+					)
+				else:
+					agent.logger.info('🔁 承認されなかったため、フィードバックなしでアクションを再生成します')
+
+				await agent._check_stop_or_pause()
+				await self.get_next_action(browser_state_summary)
+				continue
+
+			if approval.decision == 'skip':
+				agent.logger.info('⏭️ ユーザーがこのステップのアクション実行をスキップしました（インタラクティブモード）')
+				agent.state.last_result = [
+					ActionResult(
+						extracted_content='User skipped execution during interactive approval.',
+						include_in_memory=True,
+						long_term_memory='User skipped execution during interactive approval.',
+					)
+				]
+				return False
+
+			if approval.decision == 'cancel':
+				agent.logger.info('🛑 ユーザーがインタラクティブモードでエージェント実行をキャンセルしました')
+				agent.stop()
+				agent.state.last_result = [
+					ActionResult(
+						error='User cancelled execution during interactive approval.',
+					)
+				]
+				return False
+
 	async def request_human_approval(
 		self,
 		step_info: AgentStepInfo | None,
@@ -114,6 +135,11 @@ class StepExecutor:
 		return self._normalize_approval_result(raw_result)
 
 	def _normalize_approval_result(self, value: ApprovalResult | tuple[bool, str | None]) -> ApprovalResult:
+		# Exact-type checks cover what callbacks return in practice; subclasses (e.g. NamedTuple) fall through to isinstance
+		if type(value) is ApprovalResult:
+			return value
+		if type(value) is tuple and len(value) == 2:
+			return ApprovalResult.from_tuple(value)
 		if isinstance(value, ApprovalResult):
 			return value
 		if isinstance(value, tuple) and len(value) == 2:
@@ -126,7 +152,7 @@ class StepExecutor:
 		agent = self.agent
 		assert agent.browser_session is not None, 'BrowserSession is not set up'
 
-		agent.logger.debug(f'🌐 Step {agent.state.n_steps}: Getting browser state...')
+		agent.logger.debug('🌐 Step %d: Getting browser state...', agent.state.n_steps)
 		agent.logger.debug('📸 Requesting browser state with include_screenshot=True')
 		browser_state_summary = await agent.browser_session.get_browser_state_summary(
 			include_screenshot=True,
@@ -134,7 +160,7 @@ class StepExecutor:
 		)
 
 		if browser_state_summary.screenshot:
-			agent.logger.debug(f'📸 Got browser state WITH screenshot, length: {len(browser_state_summary.screenshot)}')
+			agent.logger.debug('📸 Got browser state WITH screenshot, length: %d', len(browser_state_summary.screenshot))
 		else:
 			agent.logger.debug('📸 Got browser state WITHOUT screenshot')
 
@@ -143,12 +169,12 @@ class StepExecutor:
 		agent.telemetry_handler.log_step_context(browser_state_summary)
 		await agent._check_stop_or_pause()
 
-		agent.logger.debug(f'📝 Step {agent.state.n_steps}: Updating action models...')
+		agent.logger.debug('📝 Step %d: Updating action models...', agent.state.n_steps)
 		await agent._update_action_models_for_page(browser_state_summary.url)
 
 		page_filtered_actions = agent.tools.registry.get_prompt_description(browser_state_summary.url)
 
-		agent.logger.debug(f'💬 Step {agent.state.n_steps}: Creating state messages for context...')
+		agent.logger.debug('💬 Step %d: Creating state messages for context...', agent.state.n_steps)
 		agent._message_manager.create_state_messages(
 			browser_state_summary=browser_state_summary,
 			model_output=agent.state.last_model_output,
@@ -169,7 +195,7 @@ class StepExecutor:
 		agent = self.agent
 		input_messages = agent._message_manager.get_messages()
 		agent.logger.debug(
-			f'🤖 Step {agent.state.n_steps}: Calling LLM with {len(input_messages)} messages (model: {agent.llm.model})...'
+			'🤖 Step %d: Calling LLM with %d messages (model: %s)...', agent.state.n_steps, len(input_messages), agent.llm.model
 		)
 
 		try:
@@ -191,11 +217,9 @@ class StepExecutor:
 		if agent.state.last_model_output is None:
 			raise ValueError('No model output to execute actions from')
 
-		agent.logger.debug(
-			f'⚡ Step {agent.state.n_steps}: Executing {len(agent.state.last_model_output.action)} actions...'
-		)
+		agent.logger.debug('⚡ Step %d: Executing %d actions...', agent.state.n_steps, len(agent.state.last_model_output.action))
 		result = await self.multi_act(agent.state.last_model_output.action)
-		agent.logger.debug(f'✅ Step {agent.state.n_steps}: Actions completed')
+		agent.logger.debug('✅ Step %d: Actions completed', agent.state.n_steps)
 		agent.state.last_result = result
 
 	async def post_process(self) -> None:
@@ -206,11 +230,11 @@ class StepExecutor:
 
 		if agent.state.last_result and len(agent.state.last_result) == 1 and agent.state.last_result[-1].error:
 			agent.state.consecutive_failures += 1
-			agent.logger.debug(f'🔄 Step {agent.state.n_steps}: Consecutive failures: {agent.state.consecutive_failures}')
+			agent.logger.debug('🔄 Step %d: Consecutive failures: %d', agent.state.n_steps, agent.state.consecutive_failures)
 			return
 
 		agent.state.consecutive_failures = 0
-		agent.logger.debug(f'🔄 Step {agent.state.n_steps}: Consecutive failures reset to: {agent.state.consecutive_failures}')
+		agent.logger.debug('🔄 Step %d: Consecutive failures reset to: %d', agent.state.n_steps, agent.state.consecutive_failures)
 
 		if agent.state.last_result and len(agent.state.last_result) > 0 and agent.state.last_result[-1].is_done:
 			success = agent.state.last_result[-1].success
@@ -251,14 +275,14 @@ class StepExecutor:
 		)
 		agent.state.consecutive_failures += 1
 
-		if 'Could not parse response' in error_msg or 'tool_use_failed' in error_msg:
+		if _PARSE_ERROR_RE.search(error_msg):
 			agent.logger.error(f'Model: {agent.llm.model} failed')
 			agent.logger.error(f'{prefix}{error_msg}')
 		else:
 			agent.logger.error(f'{prefix}{error_msg}')
 
 		if debug_details:
-			agent.logger.debug(f'Model provider error details:\n{debug_details}')
+			agent.logger.debug('Model provider error details:\n%s', debug_details)
 
 		agent.state.last_result = [ActionResult(error=error_msg)]
 
@@ -268,43 +292,53 @@ class StepExecutor:
 		if not agent.state.last_result:
 			return
 
+		agent.telemetry_handler.log_step_completion_summary(agent.step_start_time, agent.state.last_result)
+
+		# The history item (screenshot write) and the file-system snapshot are independent, so run them concurrently
+		pending: list[Awaitable[None]] = [asyncio.to_thread(agent.save_file_system_state)]
 		if browser_state_summary:
 			metadata = StepMetadata(
 				step_number=agent.state.n_steps,
 				step_start_time=agent.step_start_time,
 				step_end_time=step_end_time,
 			)
-
-			await agent.history_manager.create_history_item(
-				agent.state.last_model_output,
-				browser_state_summary,
-				agent.state.last_result,
-				metadata,
-				state_message=agent._message_manager.last_state_message_text,
+			pending.append(
+				agent.history_manager.create_history_item(
+					agent.state.last_model_output,
+					browser_state_summary,
+					agent.state.last_result,
+					metadata,
+					state_message=agent._message_manager.last_state_message_text,
+				)
 			)
+		await asyncio.gather(*pending)
 
-		agent.telemetry_handler.log_step_completion_summary(agent.step_start_time, agent.state.last_result)
-		agent.save_file_system_state()
-
-		if browser_state_summary and agent.state.last_model_output:
+		if browser_state_summary and agent.state.last_model_output and self._has_step_event_subscribers():
 			actions_data = []
 			if agent.state.last_model_output.action:
 				for action in agent.state.last_model_output.action:
 					action_dict = action.model_dump() if hasattr(action, 'model_dump') else {}
 					actions_data.append(action_dict)
 
-			if agent.enable_cloud_sync:
-				step_event = CreateAgentStepEvent.from_agent_step(
-					agent,
-					agent.state.last_model_output,
-					agent.state.last_result,
-					actions_data,
-					browser_state_summary,
-				)
-				agent.eventbus.dispatch(step_event)
+			step_event = CreateAgentStepEvent.from_agent_step(
+				agent,
+				agent.state.last_model_output,
+				agent.state.last_result,
+				actions_data,
+				browser_state_summary,
+			)
+			agent.eventbus.dispatch(step_event)
 
 		agent.state.n_steps += 1
 
+	def _has_step_event_subscribers(self) -> bool:
+		"""Whether a CreateAgentStepEvent would reach any handler (cloud sync subscribes via '*')."""
+		agent = self.agent
+		if not agent.enable_cloud_sync:
+			return False
+		handlers = agent.eventbus.handlers
+		return bool(handlers.get('CreateAgentStepEvent') or handlers.get('*'))
+
 	async def force_done_after_last_step(self, step_info: AgentStepInfo | None = None) -> None:
 		agent = self.agent
 		if step_info and step_info.is_last_step():
@@ -331,7 +365,7 @@ class StepExecutor:
 	async def execute_initial_actions(self) -> None:
 		agent = self.agent
 		if agent.initial_actions and not agent.state.follow_up_task:
-			agent.logger.debug(f'⚡ Executing {len(agent.initial_actions)} initial actions...')
+			agent.logger.debug('⚡ Executing %d initial actions...', len(agent.initial_actions))
 			result = await self.multi_act(agent.initial_actions, check_for_new_elements=False)
 			if result and agent.initial_url and result[0].long_term_memory:
 				result[0].long_term_memory = f'Found initial url and automatically loaded it. {result[0].long_term_memory}'
@@ -356,7 +390,9 @@ class StepExecutor:
 				agent.browser_session._cached_browser_state_summary is not None
 				and agent.browser_session._cached_browser_state_summary.dom_state is not None
 			):
-				cached_selector_map = dict(agent.browser_session._cached_browser_state_summary.dom_state.selector_map)
+				# Alias rather than copy: multi_act never writes to the map. The session clears this same dict on a
+				# focus switch, in which case lookups miss and the remaining actions are stopped as 'page changed'.
+				cached_selector_map = agent.browser_session._cached_browser_state_summary.dom_state.selector_map
 				cached_element_hashes = {e.parent_branch_hash() for e in cached_selector_map.values()}
 			else:
 				cached_selector_map = {}
@@ -367,35 +403,38 @@ class StepExecutor:
 			cached_element_hashes = set()
 
 		total_actions = len(actions)
+		# Dump every action once up front; the loop below needs the dict for the done-check,
+		# the log line and the names of any remaining actions when it bails out early.
+		action_dumps = [action.model_dump(exclude_unset=True) for action in actions]
+		action_names = [next(iter(action_data), 'unknown') for action_data in action_dumps]
+		# Selector map of the last DOM snapshot taken in this call; only refreshed after an action that can mutate the DOM
+		latest_selector_map = cached_selector_map
+		dom_may_have_changed = False
 
 		for i, action in enumerate(actions):
-			if i > 0 and action.model_dump(exclude_unset=True).get('done') is not None:
+			if i > 0 and action_dumps[i].get('done') is not None:
 				msg = f'Done action is allowed only as a single action - stopped after action {i} / {total_actions}.'
 				agent.logger.debug(msg)
 				break
 
-			if action.get_index() is not None and i != 0:
-				new_browser_state_summary = await agent.browser_session.get_browser_state_summary(
-					include_screenshot=False,
-				)
-				new_selector_map = new_browser_state_summary.dom_state.selector_map
-
-				def get_remaining_actions_str(actions: list['ActionModel'], index: int) -> str:
-					remaining_actions = []
-					for remaining_action in actions[index:]:
-						action_data = remaining_action.model_dump(exclude_unset=True)
-						action_name = next(iter(action_data.keys())) if action_data else 'unknown'
-						remaining_actions.append(action_name)
-					return ', '.join(remaining_actions)
+			action_index = action.get_index()
+			if action_index is not None and i != 0:
+				if dom_may_have_changed:
+					new_browser_state_summary = await agent.browser_session.get_browser_state_summary(
+						include_screenshot=False,
+					)
+					latest_selector_map = new_browser_state_summary.dom_state.selector_map
+					dom_may_have_changed = False
+				new_selector_map = latest_selector_map
 
-				orig_target = cached_selector_map.get(action.get_index())
+				orig_target = cached_selector_map.get(action_index)
 				orig_target_hash = orig_target.parent_branch_hash() if orig_target else None
 
-				new_target = new_selector_map.get(action.get_index())  # type: ignore
+				new_target = new_selector_map.get(action_index)  # type: ignore
 				new_target_hash = new_target.parent_branch_hash() if new_target else None
 
 				if orig_target_hash != new_target_hash:
-					remaining_actions_str = get_remaining_actions_str(actions, i)
+					remaining_actions_str = ', '.join(action_names[i:])
 					msg = f'Page changed after action: actions {remaining_actions_str} are not yet executed'
 					agent.logger.info(msg)
 					results.append(
@@ -409,8 +448,8 @@ class StepExecutor:
 
 				new_element_hashes = {e.parent_branch_hash() for e in new_selector_map.values()}
 				if check_for_new_elements and not new_element_hashes.issubset(cached_element_hashes):
-					agent.logger.debug(f'New elements: {abs(len(new_element_hashes) - len(cached_element_hashes))}')
-					remaining_actions_str = get_remaining_actions_str(actions, i)
+					agent.logger.debug('New elements: %d', abs(len(new_element_hashes) - len(cached_element_hashes)))
+					remaining_actions_str = ', '.join(action_names[i:])
 					msg = f'Something new appeared after action {i} / {total_actions}: actions {remaining_actions_str} were not executed'
 					agent.logger.info(msg)
 					results.append(
@@ -425,23 +464,16 @@ class StepExecutor:
 			if i > 0:
 				await asyncio.sleep(agent.browser_profile.wait_between_actions)
 
-			red = '\033[91m'
-			green = '\033[92m'
-			cyan = '\033[96m'
-			blue = '\033[34m'
-			reset = '\033[0m'
-
 			try:
 				await agent._check_stop_or_pause()
-				action_data = action.model_dump(exclude_unset=True)
-				action_name = next(iter(action_data.keys())) if action_data else 'unknown'
-				action_params = getattr(action, action_name, '') or str(action.model_dump(mode='json'))[:140].replace(
-					'"', ''
-				).replace('{', '').replace('}', '').replace("'", '').strip().strip(',')
+				action_name = action_names[i]
+				action_params = getattr(action, action_name, '') or str(action_dumps[i])[:140].translate(
+					_ACTION_LOG_STRIP_TABLE
+				).strip().strip(',')
 				action_params = str(action_params)
 				action_params = f'{action_params[:522]}...' if len(action_params) > 528 else action_params
-				time_start = time.time()
-				agent.logger.info(f'  🦾 {blue}[ACTION {i + 1}/{total_actions}]{reset} {action_params}')
+				time_start_ns = time.perf_counter_ns()
+				agent.logger.info(f'  🦾 {_ANSI_BLUE}[ACTION {i + 1}/{total_actions}]{_ANSI_RESET} {action_params}')
 
 				result = await agent.tools.act(
 					action=action,
@@ -452,13 +484,23 @@ class StepExecutor:
 					available_file_paths=agent.available_file_paths,
 				)
 
-				time_end = time.time()
-				time_elapsed = time_end - time_start
+				time_end_ns = time.perf_counter_ns()
 				results.append(result)
 
-				agent.logger.debug(
-					f'☑️ Executed action {i + 1}/{total_actions}: {green}{action_params}{reset} in {time_elapsed:.2f}s'
-				)
+				registered_action = agent.tools.registry.registry.actions.get(action_name)
+				if registered_action is None or registered_action.mutates_dom:
+					dom_may_have_changed = True
+
+				if agent.logger.isEnabledFor(logging.DEBUG):
+					agent.logger.debug(
+						'☑️ Executed action %d/%d: %s%s%s in %.2fs',
+						i + 1,
+						total_actions,
+						_ANSI_GREEN,
+						action_params,
+						_ANSI_RESET,
+						(time_end_ns - time_start_ns) / 1e9,
+					)
 
 				if results[-1].is_done or results[-1].error or i == total_actions - 1:
 					break
@@ -469,6 +511,16 @@ class StepExecutor:
 
 		return results
 
+	def warmup(self) -> None:
+		"""Prime per-URL caches the first step would otherwise fill on its critical path.
+
+		The first step normally runs on a blank tab, or on the URL auto-loaded from the task.
+		"""
+		agent = self.agent
+		for page_url in {'about:blank', agent.initial_url}:
+			if page_url:
+				agent.tools.registry.get_prompt_description(page_url)
+
 	async def take_step(self, step_info: AgentStepInfo | None = None) -> tuple[bool, bool]:
 		agent = self.agent
 		if step_info is not None and step_info.step_number == 0:
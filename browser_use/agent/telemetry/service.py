@@ -4,7 +4,6 @@ import json
 import logging
 import time
 from typing import TYPE_CHECKING, Sequence
-from urllib.parse import urlparse
 
 from browser_use.telemetry.views import AgentTelemetryEvent
 from browser_use.utils import check_latest_browser_use_version
@@ -15,6 +14,10 @@ if TYPE_CHECKING:
 	from browser_use.browser.views import BrowserStateSummary
 
 
+def _truncate(text: str, limit: int = 30) -> str:
+	return text if len(text) <= limit else text[:limit] + '...'
+
+
 class TelemetryHandler:
 	"""Handle Agent telemetry and related logging."""
 
@@ -44,11 +47,14 @@ class TelemetryHandler:
 
 	def log_step_context(self, browser_state_summary: 'BrowserStateSummary') -> None:
 		"""Summarise the current browser state for debugging."""
+		self.logger.info('\n')
+		self.logger.info(f'📍 Step {self.agent.state.n_steps}:')
+		if not self.logger.isEnabledFor(logging.DEBUG):
+			return
+
 		url = browser_state_summary.url if browser_state_summary else ''
 		url_short = url[:50] + '...' if len(url) > 50 else url
 		interactive_count = len(browser_state_summary.dom_state.selector_map) if browser_state_summary else 0
-		self.logger.info('\n')
-		self.logger.info(f'📍 Step {self.agent.state.n_steps}:')
 		self.logger.debug(f'Evaluating page with {interactive_count} interactive elements on: {url_short}')
 
 	def log_next_action_summary(self, parsed: 'AgentOutput') -> None:
@@ -68,15 +74,13 @@ class TelemetryHandler:
 					if key == 'index':
 						param_summary.append(f'#{value}')
 					elif key == 'text' and isinstance(value, str):
-						text_preview = value[:30] + '...' if len(value) > 30 else value
-						param_summary.append(f'text="{text_preview}"')
+						param_summary.append(f'text="{_truncate(value)}"')
 					elif key == 'url':
 						param_summary.append(f'url="{value}"')
 					elif key == 'success':
 						param_summary.append(f'success={value}')
 					elif isinstance(value, (str, int, bool)):
-						val_str = str(value)[:30] + '...' if len(str(value)) > 30 else str(value)
-						param_summary.append(f'{key}={val_str}')
+						param_summary.append(f'{key}={_truncate(str(value))}')
 
 			param_str = f'({", ".join(param_summary)})' if param_summary else ''
 			action_details.append(f'{action_name}{param_str}')
@@ -91,10 +95,12 @@ class TelemetryHandler:
 
 	def log_model_response(self, response: 'AgentOutput') -> None:
 		"""Log the model's structured response for observability."""
-		if response.current_state.thinking:
-			self.logger.debug(f'💡 Thinking:\n{response.current_state.thinking}')
+		current_state = response.current_state
+		debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+		if debug_enabled and current_state.thinking:
+			self.logger.debug(f'💡 Thinking:\n{current_state.thinking}')
 
-		eval_goal = response.current_state.evaluation_previous_goal
+		eval_goal = current_state.evaluation_previous_goal
 		if eval_goal:
 			if 'success' in eval_goal.lower():
 				emoji = '👍'
@@ -106,10 +112,10 @@ class TelemetryHandler:
 				emoji = '❔'
 				self.logger.info(f'  {emoji} Eval: {eval_goal}')
 
-		if response.current_state.memory:
-			self.logger.debug(f'🧠 Memory: {response.current_state.memory}')
+		if debug_enabled and current_state.memory:
+			self.logger.debug(f'🧠 Memory: {current_state.memory}')
 
-		next_goal = response.current_state.next_goal
+		next_goal = current_state.next_goal
 		if next_goal:
 			self.logger.info(f'  \033[34m🎯 Next goal: {next_goal}\033[0m')
 		else:
@@ -117,13 +123,13 @@ class TelemetryHandler:
 
 	def log_step_completion_summary(self, step_start_time: float, result: Sequence['ActionResult']) -> None:
 		"""Report per-step duration and success statistics."""
-		if not result:
+		if not (result and self.logger.isEnabledFor(logging.DEBUG)):
 			return
 
 		step_duration = time.time() - step_start_time
 		action_count = len(result)
-		success_count = sum(1 for r in result if not r.error)
-		failure_count = action_count - success_count
+		failure_count = sum([bool(r.error) for r in result])
+		success_count = action_count - failure_count
 
 		success_indicator = f'✅ {success_count}' if success_count > 0 else ''
 		failure_indicator = f'❌ {failure_count}' if failure_count > 0 else ''
@@ -139,22 +145,12 @@ class TelemetryHandler:
 		"""Send aggregated telemetry for the agent run."""
 		token_summary = self.agent.token_cost_service.get_usage_tokens_for_model(self.agent.llm.model)
 
-		action_history_data = []
-		for item in self.agent.history.history:
-			if item.model_output and item.model_output.action:
-				step_actions = [
-					action.model_dump(exclude_unset=True)
-					for action in item.model_output.action
-					if action
-				]
-				action_history_data.append(step_actions)
-			else:
-				action_history_data.append(None)
+		action_history_data = [item.action_dumps() for item in self.agent.history.history]
 
 		final_res = self.agent.history.final_result()
 		final_result_str = json.dumps(final_res) if final_res is not None else None
 
-		self.agent.telemetry.capture(
+		self.agent.telemetry.capture_nowait(
 			AgentTelemetryEvent(
 				task=self.agent.task,
 				model=self.agent.llm.model,
@@ -164,9 +160,7 @@ class TelemetryHandler:
 				use_vision=self.agent.settings.use_vision,
 				version=self.agent.version,
 				source=self.agent.source,
-				cdp_url=urlparse(self.agent.browser_session.cdp_url).hostname
-				if self.agent.browser_session and self.agent.browser_session.cdp_url
-				else None,
+				cdp_url=self.agent.browser_session.cdp_hostname if self.agent.browser_session else None,
 				action_errors=self.agent.history.errors(),
 				action_history=action_history_data,
 				urls_visited=self.agent.history.urls(),
@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Any, Generic, Literal
 
 from openai import RateLimitError
-from pydantic import BaseModel, ConfigDict, Field, ValidationError, create_model, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, ValidationError, create_model, model_validator
 from typing_extensions import TypeVar
 from uuid_extensions import uuid7str
 
@@ -281,8 +281,18 @@ class AgentHistory(BaseModel):
 	metadata: StepMetadata | None = None
 	state_message: str | None = None
 
+	_action_dumps: list[dict[str, Any]] | None = PrivateAttr(default=None)
+
 	model_config = ConfigDict(arbitrary_types_allowed=True, protected_namespaces=())
 
+	def action_dumps(self) -> list[dict[str, Any]] | None:
+		"""Return the step's actions dumped with exclude_unset, computed once per item."""
+		if not (self.model_output and self.model_output.action):
+			return None
+		if self._action_dumps is None:
+			self._action_dumps = [action.model_dump(exclude_unset=True) for action in self.model_output.action if action]
+		return self._action_dumps
+
 	@staticmethod
 	def get_interacted_element(model_output: AgentOutput, selector_map: DOMSelectorMap) -> list[DOMInteractedElement | None]:
 		elements = []
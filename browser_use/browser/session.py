@@ -5,6 +5,7 @@ import logging
 from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, Self, Union, cast
+from urllib.parse import urlparse
 
 import httpx
 from bubus import EventBus
@@ -325,6 +326,17 @@ class BrowserSession(BaseModel):
 		"""CDP URL from browser profile."""
 		return self.browser_profile.cdp_url
 
+	@property
+	def cdp_hostname(self) -> str | None:
+		"""Hostname of the CDP URL, parsed once per distinct cdp_url value."""
+		cdp_url = self.cdp_url
+		if not cdp_url:
+			return None
+		cached = self._cdp_hostname_cache
+		if cached is None or cached[0] != cdp_url:
+			cached = self._cdp_hostname_cache = (cdp_url, urlparse(cdp_url).hostname)
+		return cached[1]
+
 	@property
 	def is_local(self) -> bool:
 		"""Whether this is a local browser instance from browser profile."""
@@ -361,6 +373,8 @@ class BrowserSession(BaseModel):
 	_permissions_watchdog: Any | None = PrivateAttr(default=None)
 	_recording_watchdog: Any | None = PrivateAttr(default=None)
 
+	_cdp_hostname_cache: tuple[str, str | None] | None = PrivateAttr(default=None)
+
 	_logger: Any = PrivateAttr(default=None)
 
 	@property
@@ -1618,8 +1632,6 @@ class BrowserSession(BaseModel):
 				if (not title or title == '') and (url.endswith('.pdf') or 'pdf' in url):
 					# PDF pages might not have a title, use URL filename
 					try:
-						from urllib.parse import urlparse
-
 						filename = urlparse(url).path.split('/')[-1]
 						if filename:
 							title = filename
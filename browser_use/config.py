@@ -3,18 +3,29 @@ from __future__ import annotations
 import logging
 import os
 import re
+from collections.abc import Mapping
 from copy import deepcopy
 from functools import cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import psutil
 import yaml
 
+try:
+	from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+	from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
 ENV_PATTERN = re.compile(r'\$\{([A-Za-z0-9_]+)(?::([^}]*))?\}')
 
+# 設定ファイルのパース結果を (mtime_ns, size) で検証して再利用する。
+# 環境変数の展開は参照先の値が変わり得るため、キャッシュ後に毎回行う。
+_PARSE_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any], bool]] = {}
+
 DEFAULT_CONFIG: dict[str, Any] = {
 	'paths': {
 		'config_home': '~/.config',
@@ -89,18 +100,27 @@ def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any
 	return base
 
 
+def _env_replacer(match: re.Match[str]) -> str:
+	return os.getenv(match.group(1), match.group(2) or '')
+
+
 def _expand_env_vars(value: Any) -> Any:
 	if isinstance(value, str):
-		def replacer(match: re.Match[str]) -> str:
-			variable = match.group(1)
-			default = match.group(2) or ''
-			return os.getenv(variable, default)
-
-		return ENV_PATTERN.sub(replacer, value)
+		if '${' not in value:
+			return value
+		return ENV_PATTERN.sub(_env_replacer, value)
 	if isinstance(value, dict):
-		return {key: _expand_env_vars(sub_value) for key, sub_value in value.items()}
+		for key, sub_value in value.items():
+			expanded = _expand_env_vars(sub_value)
+			if expanded is not sub_value:
+				value[key] = expanded
+		return value
 	if isinstance(value, list):
-		return [_expand_env_vars(item) for item in value]
+		for index, item in enumerate(value):
+			expanded = _expand_env_vars(item)
+			if expanded is not item:
+				value[index] = expanded
+		return value
 	return value
 
 
@@ -121,20 +141,34 @@ def _resolve_config_file() -> Path | None:
 	return None
 
 
+def _parse_config_file(source_path: Path) -> tuple[dict[str, Any], bool]:
+	stat = source_path.stat()
+	signature = (stat.st_mtime_ns, stat.st_size)
+	cached = _PARSE_CACHE.get(str(source_path))
+	if cached is not None and cached[0] == signature:
+		return cached[1], cached[2]
+
+	raw_text = source_path.read_text(encoding='utf-8')
+	loaded = yaml.load(raw_text, Loader=_YamlLoader) or {}
+	if not isinstance(loaded, dict):
+		raise ConfigLoadError(
+			f'Config file {source_path} must contain a mapping at the top level. '
+			'Please verify the YAML structure.'
+		)
+	has_placeholders = '${' in raw_text
+	_PARSE_CACHE[str(source_path)] = (signature, loaded, has_placeholders)
+	return loaded, has_placeholders
+
+
 def _load_config_data() -> tuple[dict[str, Any], Path | None]:
 	config = deepcopy(DEFAULT_CONFIG)
 	source_path = _resolve_config_file()
+	has_placeholders = False
 
 	if source_path:
 		try:
-			with source_path.open('r', encoding='utf-8') as handle:
-				loaded = yaml.safe_load(handle) or {}
-				if not isinstance(loaded, dict):
-					raise ConfigLoadError(
-						f'Config file {source_path} must contain a mapping at the top level. '
-						'Please verify the YAML structure.'
-					)
-				config = _deep_merge(config, loaded)
+			loaded, has_placeholders = _parse_config_file(source_path)
+			config = _deep_merge(config, loaded)
 		except FileNotFoundError:
 			logger.debug('Config file %s disappeared during load, falling back to defaults', source_path)
 			source_path = None
@@ -144,10 +178,19 @@ def _load_config_data() -> tuple[dict[str, Any], Path | None]:
 				'Check the YAML syntax and file permissions.'
 			) from exc
 
-	config = _expand_env_vars(config)
+	if has_placeholders:
+		config = _expand_env_vars(config)
 	return config, source_path
 
 
+def _freeze(value: Any) -> Any:
+	if isinstance(value, dict):
+		return MappingProxyType({key: _freeze(sub_value) for key, sub_value in value.items()})
+	if isinstance(value, list):
+		return tuple(_freeze(item) for item in value)
+	return value
+
+
 def _parse_bool(value: Any, *, default: bool = False) -> bool:
 	if value is None:
 		return default
@@ -158,6 +201,59 @@ def _parse_bool(value: Any, *, default: bool = False) -> bool:
 	return bool(value)
 
 
+def _setting_fallbacks(settings: dict[str, Any]) -> dict[str, Any]:
+	logging_settings = settings.get('logging', {})
+	telemetry_settings = settings.get('telemetry', {})
+	llm_settings = settings.get('llm', {})
+	api_keys = llm_settings.get('api_keys') or {}
+	debug_log_file = logging_settings.get('debug_log_file')
+	info_log_file = logging_settings.get('info_log_file')
+	cloud_sync = telemetry_settings.get('cloud_sync')
+
+	return {
+		'BROWSER_USE_LOGGING_LEVEL': str(logging_settings.get('level', 'info')).lower(),
+		'CDP_LOGGING_LEVEL': str(logging_settings.get('cdp_level', 'WARNING')).upper(),
+		'BROWSER_USE_DEBUG_LOG_FILE': str(debug_log_file) if debug_log_file else None,
+		'BROWSER_USE_INFO_LOG_FILE': str(info_log_file) if info_log_file else None,
+		'ANONYMIZED_TELEMETRY': _parse_bool(telemetry_settings.get('anonymized', True), default=True),
+		'BROWSER_USE_CLOUD_SYNC': None if cloud_sync is None else _parse_bool(cloud_sync),
+		'BROWSER_USE_CLOUD_API_URL': telemetry_settings.get('cloud_api_url', 'https://api.browser-use.com'),
+		'BROWSER_USE_CLOUD_UI_URL': telemetry_settings.get('cloud_ui_url', ''),
+		'DEFAULT_LLM': llm_settings.get('default_model', ''),
+		'SKIP_LLM_API_KEY_VERIFICATION': _parse_bool(llm_settings.get('skip_api_key_verification'), default=False),
+		'OPENAI_API_KEY': api_keys.get('openai', ''),
+		'ANTHROPIC_API_KEY': api_keys.get('anthropic', ''),
+		'GOOGLE_API_KEY': api_keys.get('google', ''),
+		'DEEPSEEK_API_KEY': api_keys.get('deepseek', ''),
+		'GROK_API_KEY': api_keys.get('grok', ''),
+		'NOVITA_API_KEY': api_keys.get('novita', ''),
+		'AZURE_OPENAI_ENDPOINT': llm_settings.get('azure_endpoint', ''),
+		'AZURE_OPENAI_KEY': api_keys.get('azure', ''),
+	}
+
+
+_PATH_ENV_VARS = ('XDG_CACHE_HOME', 'XDG_CONFIG_HOME', 'BROWSER_USE_CONFIG_DIR', 'WIN_FONT_DIR')
+
+
+def _ensure_directory(directory: Path) -> None:
+	try:
+		directory.mkdir(parents=True, exist_ok=True)
+		if os.name != 'nt':
+			try:
+				directory.chmod(0o700)
+			except PermissionError:
+				logger.warning('Could not set permissions on %s; please ensure it is not world-readable.', directory)
+	except Exception as exc:
+		logger.warning('Failed to create directory %s: %s', directory, exc)
+
+
+@cache
+def _ensure_directories(config_dir: str, profiles_dir: str, downloads_dir: str, extensions_dir: str) -> None:
+	# 同じパスの組み合わせに対しては mkdir/chmod をプロセス内で一度だけ実行する
+	for directory in (config_dir, profiles_dir, downloads_dir, extensions_dir):
+		_ensure_directory(Path(directory))
+
+
 def _resolved_paths(settings: dict[str, Any]) -> dict[str, Path | str]:
 	paths_settings = settings.get('paths', {})
 
@@ -184,21 +280,7 @@ def _resolved_paths(settings: dict[str, Any]) -> dict[str, Path | str]:
 		paths_settings.get('default_user_data_dir') or (profiles_dir / 'default')
 	).expanduser()
 
-	def _ensure_directory(directory: Path) -> None:
-		try:
-			directory.mkdir(parents=True, exist_ok=True)
-			if os.name != 'nt':
-				try:
-					directory.chmod(0o700)
-				except PermissionError:
-					logger.warning(
-						'Could not set permissions on %s; please ensure it is not world-readable.', directory
-					)
-		except Exception as exc:
-			logger.warning('Failed to create directory %s: %s', directory, exc)
-
-	for directory in (config_dir, profiles_dir, downloads_dir, extensions_dir):
-		_ensure_directory(directory)
+	_ensure_directories(str(config_dir), str(profiles_dir), str(downloads_dir), str(extensions_dir))
 
 	windows_font_dir = os.getenv('WIN_FONT_DIR') or paths_settings.get('windows_font_dir') or 'C:\\Windows\\Fonts'
 
@@ -216,21 +298,25 @@ def _resolved_paths(settings: dict[str, Any]) -> dict[str, Path | str]:
 
 @cache
 def is_running_in_docker() -> bool:
+	# Cheapest signals first; the psutil.pids() process-count heuristic was dropped because it
+	# enumerates all of /proc and misfires on small hosts
 	try:
-		if Path('/.dockerenv').exists() or 'docker' in Path('/proc/1/cgroup').read_text().lower():
+		if Path('/.dockerenv').exists():
 			return True
 	except Exception:
 		pass
 
 	try:
-		init_cmd = ' '.join(psutil.Process(1).cmdline())
-		if ('py' in init_cmd) or ('uv' in init_cmd) or ('app' in init_cmd):
+		with open('/proc/1/cgroup', 'rb') as handle:
+			cgroup = handle.read(4096)
+		if b'docker' in cgroup or b'containerd' in cgroup or b'kubepods' in cgroup:
 			return True
 	except Exception:
 		pass
 
 	try:
-		if len(psutil.pids()) < 10:
+		init_cmd = ' '.join(psutil.Process(1).cmdline())
+		if ('py' in init_cmd) or ('uv' in init_cmd) or ('app' in init_cmd):
 			return True
 	except Exception:
 		pass
@@ -241,20 +327,43 @@ def is_running_in_docker() -> bool:
 class Config:
 	def __init__(self) -> None:
 		self._raw: dict[str, Any] | None = None
+		self._frozen: Mapping[str, Any] = MappingProxyType({})
+		self._fallback_values: dict[str, Any] = {}
 		self._source: Path | None = None
+		self._resolved: dict[str, Path | str] | None = None
+		self._resolved_env: tuple[str | None, ...] | None = None
 
-	def reload(self) -> dict[str, Any]:
+	def reload(self) -> Mapping[str, Any]:
 		self._raw, self._source = _load_config_data()
-		return deepcopy(self._raw)
+		self._frozen = _freeze(self._raw)
+		self._fallback_values = _setting_fallbacks(self._raw)
+		self._resolved = None
+		return self._frozen
 
 	def _settings(self) -> dict[str, Any]:
 		if self._raw is None:
 			self.reload()
 		return self._raw or {}
 
+	def _fallbacks(self) -> dict[str, Any]:
+		# 設定ファイル由来の値は reload 時にまとめて計算し、環境変数だけを毎回参照する
+		self._settings()
+		return self._fallback_values
+
+	def _get_resolved(self) -> dict[str, Path | str]:
+		# パス関連の環境変数は遅延評価のまま、値が変わらない限り解決結果を再利用する
+		settings = self._settings()
+		env_key = tuple(os.getenv(name) for name in _PATH_ENV_VARS)
+		if self._resolved is None or env_key != self._resolved_env:
+			self._resolved = _resolved_paths(settings)
+			self._resolved_env = env_key
+		return self._resolved
+
 	@property
-	def data(self) -> dict[str, Any]:
-		return deepcopy(self._settings())
+	def data(self) -> Mapping[str, Any]:
+		"""Read-only snapshot of the loaded settings, shared between callers."""
+		self._settings()
+		return self._frozen
 
 	@property
 	def source(self) -> Path | None:
@@ -266,11 +375,11 @@ class Config:
 			self.reload()
 
 		settings = self._settings()
-		paths = _resolved_paths(settings)
+		paths = self._get_resolved()
 
-		browser_settings = deepcopy(settings.get('browser', {}))
-		llm_settings = deepcopy(settings.get('llm', {}))
-		agent_settings = deepcopy(settings.get('agent', {}))
+		browser_settings = dict(settings.get('browser', {}))
+		llm_settings = dict(settings.get('llm', {}))
+		agent_settings = dict(settings.get('agent', {}))
 
 		browser_profile = {
 			'headless': _parse_bool(browser_settings.get('headless'), default=False),
@@ -323,38 +432,26 @@ class Config:
 
 	@property
 	def BROWSER_USE_LOGGING_LEVEL(self) -> str:
-		settings = self._settings()
-		base_level = str(settings.get('logging', {}).get('level', 'info')).lower()
-		return os.getenv('BROWSER_USE_LOGGING_LEVEL', base_level).lower()
+		return os.getenv('BROWSER_USE_LOGGING_LEVEL', self._fallbacks()['BROWSER_USE_LOGGING_LEVEL']).lower()
 
 	@property
 	def CDP_LOGGING_LEVEL(self) -> str:
-		settings = self._settings()
-		default_level = str(settings.get('logging', {}).get('cdp_level', 'WARNING')).upper()
-		return os.getenv('CDP_LOGGING_LEVEL', default_level).upper()
+		return os.getenv('CDP_LOGGING_LEVEL', self._fallbacks()['CDP_LOGGING_LEVEL']).upper()
 
 	@property
 	def BROWSER_USE_DEBUG_LOG_FILE(self) -> str | None:
-		settings = self._settings()
-		file_value = settings.get('logging', {}).get('debug_log_file')
-		override = os.getenv('BROWSER_USE_DEBUG_LOG_FILE')
-		return override or (str(file_value) if file_value else None)
+		return os.getenv('BROWSER_USE_DEBUG_LOG_FILE') or self._fallbacks()['BROWSER_USE_DEBUG_LOG_FILE']
 
 	@property
 	def BROWSER_USE_INFO_LOG_FILE(self) -> str | None:
-		settings = self._settings()
-		file_value = settings.get('logging', {}).get('info_log_file')
-		override = os.getenv('BROWSER_USE_INFO_LOG_FILE')
-		return override or (str(file_value) if file_value else None)
+		return os.getenv('BROWSER_USE_INFO_LOG_FILE') or self._fallbacks()['BROWSER_USE_INFO_LOG_FILE']
 
 	@property
 	def ANONYMIZED_TELEMETRY(self) -> bool:
-		settings = self._settings()
-		config_value = settings.get('telemetry', {}).get('anonymized', True)
 		env_value = os.getenv('ANONYMIZED_TELEMETRY')
 		if env_value is not None:
 			return _parse_bool(env_value, default=True)
-		return _parse_bool(config_value, default=True)
+		return self._fallbacks()['ANONYMIZED_TELEMETRY']
 
 	@property
 	def BROWSER_USE_CLOUD_SYNC(self) -> bool:
@@ -362,85 +459,61 @@ class Config:
 		if env_value is not None:
 			return _parse_bool(env_value, default=False)
 
-		settings = self._settings()
-		config_value = settings.get('telemetry', {}).get('cloud_sync')
+		config_value = self._fallbacks()['BROWSER_USE_CLOUD_SYNC']
 		if config_value is None:
 			return self.ANONYMIZED_TELEMETRY
-		return _parse_bool(config_value, default=self.ANONYMIZED_TELEMETRY)
+		return config_value
 
 	@property
 	def BROWSER_USE_CLOUD_API_URL(self) -> str:
-		settings = self._settings()
-		default_url = settings.get('telemetry', {}).get('cloud_api_url', 'https://api.browser-use.com')
-		return os.getenv('BROWSER_USE_CLOUD_API_URL', default_url)
+		return os.getenv('BROWSER_USE_CLOUD_API_URL', self._fallbacks()['BROWSER_USE_CLOUD_API_URL'])
 
 	@property
 	def BROWSER_USE_CLOUD_UI_URL(self) -> str:
-		settings = self._settings()
-		default_url = settings.get('telemetry', {}).get('cloud_ui_url', '')
-		return os.getenv('BROWSER_USE_CLOUD_UI_URL', default_url)
+		return os.getenv('BROWSER_USE_CLOUD_UI_URL', self._fallbacks()['BROWSER_USE_CLOUD_UI_URL'])
 
 	@property
 	def DEFAULT_LLM(self) -> str:
-		settings = self._settings()
-		default_model = settings.get('llm', {}).get('default_model', '')
-		return os.getenv('DEFAULT_LLM', default_model)
+		return os.getenv('DEFAULT_LLM', self._fallbacks()['DEFAULT_LLM'])
 
 	@property
 	def SKIP_LLM_API_KEY_VERIFICATION(self) -> bool:
 		env_value = os.getenv('SKIP_LLM_API_KEY_VERIFICATION')
 		if env_value is not None:
 			return _parse_bool(env_value, default=False)
-		settings = self._settings()
-		return _parse_bool(settings.get('llm', {}).get('skip_api_key_verification'), default=False)
+		return self._fallbacks()['SKIP_LLM_API_KEY_VERIFICATION']
 
 	@property
 	def OPENAI_API_KEY(self) -> str:
-		settings = self._settings()
-		fallback = (settings.get('llm', {}).get('api_keys') or {}).get('openai', '')
-		return os.getenv('OPENAI_API_KEY', fallback)
+		return os.getenv('OPENAI_API_KEY', self._fallbacks()['OPENAI_API_KEY'])
 
 	@property
 	def ANTHROPIC_API_KEY(self) -> str:
-		settings = self._settings()
-		fallback = (settings.get('llm', {}).get('api_keys') or {}).get('anthropic', '')
-		return os.getenv('ANTHROPIC_API_KEY', fallback)
+		return os.getenv('ANTHROPIC_API_KEY', self._fallbacks()['ANTHROPIC_API_KEY'])
 
 	@property
 	def GOOGLE_API_KEY(self) -> str:
-		settings = self._settings()
-		fallback = (settings.get('llm', {}).get('api_keys') or {}).get('google', '')
-		return os.getenv('GOOGLE_API_KEY', fallback)
+		return os.getenv('GOOGLE_API_KEY', self._fallbacks()['GOOGLE_API_KEY'])
 
 	@property
 	def DEEPSEEK_API_KEY(self) -> str:
-		settings = self._settings()
-		fallback = (settings.get('llm', {}).get('api_keys') or {}).get('deepseek', '')
-		return os.getenv('DEEPSEEK_API_KEY', fallback)
+		return os.getenv('DEEPSEEK_API_KEY', self._fallbacks()['DEEPSEEK_API_KEY'])
 
 	@property
 	def GROK_API_KEY(self) -> str:
-		settings = self._settings()
-		fallback = (settings.get('llm', {}).get('api_keys') or {}).get('grok', '')
-		return os.getenv('GROK_API_KEY', fallback)
+		return os.getenv('GROK_API_KEY', self._fallbacks()['GROK_API_KEY'])
 
 	@property
 	def NOVITA_API_KEY(self) -> str:
-		settings = self._settings()
-		fallback = (settings.get('llm', {}).get('api_keys') or {}).get('novita', '')
-		return os.getenv('NOVITA_API_KEY', fallback)
+		return os.getenv('NOVITA_API_KEY', self._fallbacks()['NOVITA_API_KEY'])
 
 	@property
 	def AZURE_OPENAI_ENDPOINT(self) -> str:
-		settings = self._settings()
-		fallback = settings.get('llm', {}).get('azure_endpoint', '')
-		return os.getenv('AZURE_OPENAI_ENDPOINT', fallback)
+		return os.getenv('AZURE_OPENAI_ENDPOINT', self._fallbacks()['AZURE_OPENAI_ENDPOINT'])
 
 	@property
 	def AZURE_OPENAI_KEY(self) -> str:
-		settings = self._settings()
-		fallback = (settings.get('llm', {}).get('api_keys') or {}).get('azure', '')
-		return os.getenv('AZURE_OPENAI_KEY', fallback)
+		return os.getenv('AZURE_OPENAI_KEY', self._fallbacks()['AZURE_OPENAI_KEY'])
 
 	@property
 	def IN_DOCKER(self) -> bool:
@@ -456,15 +529,15 @@ class Config:
 
 	@property
 	def XDG_CACHE_HOME(self) -> Path:
-		return _resolved_paths(self._settings())['cache_home']
+		return self._get_resolved()['cache_home']
 
 	@property
 	def XDG_CONFIG_HOME(self) -> Path:
-		return _resolved_paths(self._settings())['config_home']
+		return self._get_resolved()['config_home']
 
 	@property
 	def BROWSER_USE_CONFIG_DIR(self) -> Path:
-		return _resolved_paths(self._settings())['config_dir']
+		return self._get_resolved()['config_dir']
 
 	@property
 	def BROWSER_USE_CONFIG_FILE(self) -> Path:
@@ -472,27 +545,28 @@ class Config:
 
 	@property
 	def BROWSER_USE_PROFILES_DIR(self) -> Path:
-		return _resolved_paths(self._settings())['profiles_dir']
+		return self._get_resolved()['profiles_dir']
 
 	@property
 	def BROWSER_USE_DEFAULT_USER_DATA_DIR(self) -> Path:
-		return _resolved_paths(self._settings())['default_user_data_dir']
+		return self._get_resolved()['default_user_data_dir']
 
 	@property
 	def BROWSER_USE_DOWNLOADS_DIR(self) -> Path:
-		return _resolved_paths(self._settings())['downloads_dir']
+		return self._get_resolved()['downloads_dir']
 
 	@property
 	def BROWSER_USE_EXTENSIONS_DIR(self) -> Path:
-		return _resolved_paths(self._settings())['extensions_dir']
+		return self._get_resolved()['extensions_dir']
 
 	@property
 	def WIN_FONT_DIR(self) -> str:
-		return str(_resolved_paths(self._settings())['windows_font_dir'])
+		return str(self._get_resolved()['windows_font_dir'])
 
 
 def _apply_env_overrides(config: dict[str, Any]) -> dict[str, Any]:
-	result = deepcopy(config)
+	result = dict(config)
+	result['browser_profile'] = dict(config.get('browser_profile') or {})
 
 	if (headless := os.getenv('BROWSER_USE_HEADLESS')) is not None:
 		result['browser_profile']['headless'] = _parse_bool(headless, default=result['browser_profile'].get('headless', False))
@@ -524,7 +598,7 @@ def _apply_env_overrides(config: dict[str, Any]) -> dict[str, Any]:
 	if existing_proxy:
 		result['browser_profile']['proxy'] = existing_proxy
 
-	llm_section = result.setdefault('llm', {})
+	llm_section = result['llm'] = dict(result.get('llm') or {})
 	if os.getenv('OPENAI_API_KEY'):
 		llm_section['api_key'] = os.getenv('OPENAI_API_KEY', '')
 
@@ -537,7 +611,7 @@ def _apply_env_overrides(config: dict[str, Any]) -> dict[str, Any]:
 CONFIG = Config()
 
 
-def load_config_yaml(*, reload: bool = False) -> dict[str, Any]:
+def load_config_yaml(*, reload: bool = False) -> Mapping[str, Any]:
 	if reload:
 		return CONFIG.reload()
 	return CONFIG.data
@@ -548,12 +622,12 @@ def load_browser_use_config(*, reload: bool = False) -> dict[str, Any]:
 
 
 def get_default_profile(config: dict[str, Any]) -> dict[str, Any]:
-	return deepcopy(config.get('browser_profile', {}))
+	return dict(config.get('browser_profile', {}))
 
 
 def get_default_llm(config: dict[str, Any]) -> dict[str, Any]:
-	return deepcopy(config.get('llm', {}))
+	return dict(config.get('llm', {}))
 
 
 def get_default_agent(config: dict[str, Any]) -> dict[str, Any]:
-	return deepcopy(config.get('agent', {}))
+	return dict(config.get('agent', {}))
@@ -18,6 +18,11 @@ from browser_use.filesystem.file_system import FileSystem
 TIMEOUT = 60
 
 
+async def _dump(path: str, text: str) -> None:
+	async with await anyio.open_file(path, 'w', encoding='utf-8') as f:
+		await f.write(text)
+
+
 async def test_focus_vs_all_elements():
 	browser_session = BrowserSession(
 		browser_profile=BrowserProfile(
@@ -162,16 +167,20 @@ async def test_focus_vs_all_elements():
 				text_to_save = user_message
 
 				os.makedirs('./tmp', exist_ok=True)
-				async with await anyio.open_file('./tmp/user_message.txt', 'w', encoding='utf-8') as f:
-					await f.write(text_to_save)
+				writes = [_dump('./tmp/user_message.txt', text_to_save)]
 
 				# save pure clickable elements to a file
-				if all_elements_state.dom_state._root:
-					async with await anyio.open_file('./tmp/simplified_element_tree.json', 'w', encoding='utf-8') as f:
-						await f.write(json.dumps(all_elements_state.dom_state._root.__json__(), indent=2))
-
-					async with await anyio.open_file('./tmp/original_element_tree.json', 'w', encoding='utf-8') as f:
-						await f.write(json.dumps(all_elements_state.dom_state._root.original_node.__json__(), indent=2))
+				if root := all_elements_state.dom_state._root:
+					# Encode both trees off the event loop in parallel, then write all files concurrently
+					# Compact separators: these dumps are large and read by tools, not by eye
+					simplified_json, original_json = await asyncio.gather(
+						asyncio.to_thread(json.dumps, root.__json__(), separators=(',', ':')),
+						asyncio.to_thread(json.dumps, root.original_node.__json__(), separators=(',', ':')),
+					)
+					writes.append(_dump('./tmp/simplified_element_tree.json', simplified_json))
+					writes.append(_dump('./tmp/original_element_tree.json', original_json))
+
+				await asyncio.gather(*writes)
 
 				# copy the user message to the clipboard
 				# pyperclip.copy(text_to_save)
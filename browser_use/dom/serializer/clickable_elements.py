@@ -1,7 +1,72 @@
+from collections.abc import Iterable
+
 from browser_use.dom.views import EnhancedDOMTreeNode, NodeType
 
+# Lookup sets are built once at import instead of on every is_interactive() call
+_SEARCH_INDICATORS = frozenset(
+	{
+		'search',
+		'magnify',
+		'glass',
+		'lookup',
+		'find',
+		'query',
+		'search-icon',
+		'search-btn',
+		'search-button',
+		'searchbox',
+	}
+)
+
+# Note: 'label' removed - labels are handled by other attribute checks below - other wise labels with "for" attribute can destroy the real clickable element on apartments.com
+_INTERACTIVE_TAGS = frozenset(
+	{
+		'button',
+		'input',
+		'select',
+		'textarea',
+		'a',
+		'details',
+		'summary',
+		'option',
+		'optgroup',
+	}
+)
+
+_INTERACTIVE_ATTRIBUTES = frozenset({'onclick', 'onmousedown', 'onmouseup', 'onkeydown', 'onkeyup', 'tabindex'})
+
+_INTERACTIVE_ROLES = frozenset(
+	{
+		'button',
+		'link',
+		'menuitem',
+		'option',
+		'radio',
+		'checkbox',
+		'tab',
+		'textbox',
+		'combobox',
+		'slider',
+		'spinbutton',
+		'search',
+		'searchbox',
+	}
+)
+
+_INTERACTIVE_AX_ROLES = _INTERACTIVE_ROLES | {'listbox'}
+
+_ICON_ATTRIBUTES = frozenset({'class', 'role', 'onclick', 'data-action', 'aria-label'})
+
 
 class ClickableElementDetector:
+	@staticmethod
+	def classify_batch(nodes: Iterable[EnhancedDOMTreeNode]) -> dict[int, bool]:
+		"""Classify many nodes in one pass, keyed by node_id."""
+		is_interactive = ClickableElementDetector.is_interactive
+		element_node = NodeType.ELEMENT_NODE
+		# Non-element nodes are never interactive, skip the full check for them
+		return {node.node_id: node.node_type == element_node and is_interactive(node) for node in nodes}
+
 	@staticmethod
 	def is_interactive(node: EnhancedDOMTreeNode) -> bool:
 		"""Check if this node is clickable/interactive using enhanced scoring."""
@@ -34,32 +99,19 @@ class ClickableElementDetector:
 
 		# SEARCH ELEMENT DETECTION: Check for search-related classes and attributes
 		if node.attributes:
-			search_indicators = {
-				'search',
-				'magnify',
-				'glass',
-				'lookup',
-				'find',
-				'query',
-				'search-icon',
-				'search-btn',
-				'search-button',
-				'searchbox',
-			}
-
 			# Check class names for search indicators
 			class_list = node.attributes.get('class', '').lower().split()
-			if any(indicator in ' '.join(class_list) for indicator in search_indicators):
+			if any(indicator in ' '.join(class_list) for indicator in _SEARCH_INDICATORS):
 				return True
 
 			# Check id for search indicators
 			element_id = node.attributes.get('id', '').lower()
-			if any(indicator in element_id for indicator in search_indicators):
+			if any(indicator in element_id for indicator in _SEARCH_INDICATORS):
 				return True
 
 			# Check data attributes for search functionality
 			for attr_name, attr_value in node.attributes.items():
-				if attr_name.startswith('data-') and any(indicator in attr_value.lower() for indicator in search_indicators):
+				if attr_name.startswith('data-') and any(indicator in attr_value.lower() for indicator in _SEARCH_INDICATORS):
 					return True
 
 		# Enhanced accessibility property checks - direct clear indicators only
@@ -95,19 +147,7 @@ class ClickableElementDetector:
 					continue
 
 				# ENHANCED TAG CHECK: Include truly interactive elements
-		# Note: 'label' removed - labels are handled by other attribute checks below - other wise labels with "for" attribute can destroy the real clickable element on apartments.com
-		interactive_tags = {
-			'button',
-			'input',
-			'select',
-			'textarea',
-			'a',
-			'details',
-			'summary',
-			'option',
-			'optgroup',
-		}
-		if node.tag_name in interactive_tags:
+		if node.tag_name in _INTERACTIVE_TAGS:
 			return True
 
 		# SVG elements need special handling - only interactive if they have explicit handlers
@@ -133,49 +173,17 @@ class ClickableElementDetector:
 		# Tertiary check: elements with interactive attributes
 		if node.attributes:
 			# Check for event handlers or interactive attributes
-			interactive_attributes = {'onclick', 'onmousedown', 'onmouseup', 'onkeydown', 'onkeyup', 'tabindex'}
-			if any(attr in node.attributes for attr in interactive_attributes):
+			if any(attr in node.attributes for attr in _INTERACTIVE_ATTRIBUTES):
 				return True
 
 			# Check for interactive ARIA roles
 			if 'role' in node.attributes:
-				interactive_roles = {
-					'button',
-					'link',
-					'menuitem',
-					'option',
-					'radio',
-					'checkbox',
-					'tab',
-					'textbox',
-					'combobox',
-					'slider',
-					'spinbutton',
-					'search',
-					'searchbox',
-				}
-				if node.attributes['role'] in interactive_roles:
+				if node.attributes['role'] in _INTERACTIVE_ROLES:
 					return True
 
 		# Quaternary check: accessibility tree roles
 		if node.ax_node and node.ax_node.role:
-			interactive_ax_roles = {
-				'button',
-				'link',
-				'menuitem',
-				'option',
-				'radio',
-				'checkbox',
-				'tab',
-				'textbox',
-				'combobox',
-				'slider',
-				'spinbutton',
-				'listbox',
-				'search',
-				'searchbox',
-			}
-			if node.ax_node.role in interactive_ax_roles:
+			if node.ax_node.role in _INTERACTIVE_AX_ROLES:
 				return True
 
 		# ICON AND SMALL ELEMENT CHECK: Elements that might be icons
@@ -188,8 +196,7 @@ class ClickableElementDetector:
 			# Check if this small element has interactive properties
 			if node.attributes:
 				# Small elements with these attributes are likely interactive icons
-				icon_attributes = {'class', 'role', 'onclick', 'data-action', 'aria-label'}
-				if any(attr in node.attributes for attr in icon_attributes):
+				if any(attr in node.attributes for attr in _ICON_ATTRIBUTES):
 					return True
 
 		# Final fallback: cursor style indicates interactivity (for cases Chrome missed)
@@ -1,5 +1,7 @@
 # @file purpose: Serializes enhanced DOM trees to string format for LLM consumption
 
+import time
+from collections.abc import Iterator
 from typing import Any
 
 from browser_use.dom.serializer.clickable_elements import ClickableElementDetector
@@ -15,7 +17,16 @@ from browser_use.dom.views import (
 	SimplifiedNode,
 )
 
-DISABLED_ELEMENTS = {'style', 'script', 'head', 'meta', 'link', 'title'}
+# Non-content elements; their whole subtree is skipped without descending into it
+DISABLED_ELEMENTS = frozenset({'style', 'script', 'head', 'meta', 'link', 'title', 'noscript', 'template'})
+
+# Indent prefixes for serialize_tree, built once; deeper nodes fall back to multiplying
+_INDENT = tuple('\t' * i for i in range(64))
+
+
+# Open-time facts for one node of the simplified tree walk:
+# (children to visit, visible-or-scrollable if already known, is shadow host / None when not a regular element)
+_OpenDecision = tuple[list[EnhancedDOMTreeNode], bool | None, bool | None]
 
 
 class DOMTreeSerializer:
@@ -43,13 +54,17 @@ class DOMTreeSerializer:
 		enable_bbox_filtering: bool = True,
 		containment_threshold: float | None = None,
 		paint_order_filtering: bool = True,
+		collect_timing: bool = False,
 	):
 		self.root_node = root_node
 		self._interactive_counter = 1
 		self._selector_map: DOMSelectorMap = {}
 		self._previous_cached_selector_map = previous_cached_state.selector_map if previous_cached_state else None
+		self._previous_backend_ids: frozenset[int] = frozenset()
 		# Add timing tracking
 		self.timing_info: dict[str, float] = {}
+		# Per-node clickable detection timing costs two clock reads per node, so it is opt-in
+		self._collect_timing = collect_timing
 		# Cache for clickable element detection to avoid redundant calls
 		self._clickable_cache: dict[int, bool] = {}
 		# Bounding box filtering configuration
@@ -75,8 +90,6 @@ class DOMTreeSerializer:
 			return None
 
 	def serialize_accessible_elements(self) -> tuple[SerializedDOMState, dict[str, float]]:
-		import time
-
 		start_total = time.time()
 
 		# Reset state
@@ -84,25 +97,25 @@ class DOMTreeSerializer:
 		self._selector_map = {}
 		self._semantic_groups = []
 		self._clickable_cache = {}  # Clear cache for new serialization
-
-		# Step 1: Create simplified tree (includes clickable element detection)
+		# Backend ids of the previous selector map, built once for the "is new" check
+		self._previous_backend_ids = (
+			frozenset(node.backend_node_id for node in self._previous_cached_selector_map.values())
+			if self._previous_cached_selector_map
+			else frozenset()
+		)
+
+		# Step 1: Create simplified tree, pruning unnecessary parents in the same pass
 		start_step1 = time.time()
-		simplified_tree = self._create_simplified_tree(self.root_node)
+		optimized_tree = self._create_simplified_tree(self.root_node)
 		end_step1 = time.time()
 		self.timing_info['create_simplified_tree'] = end_step1 - start_step1
 
 		# Step 2: Remove elements based on paint order
-		start_step3 = time.time()
-		if self.paint_order_filtering and simplified_tree:
-			PaintOrderRemover(simplified_tree).calculate_paint_order()
-		end_step3 = time.time()
-		self.timing_info['calculate_paint_order'] = end_step3 - start_step3
-
-		# Step 3: Optimize tree (remove unnecessary parents)
 		start_step2 = time.time()
-		optimized_tree = self._optimize_tree(simplified_tree)
+		if self.paint_order_filtering and optimized_tree:
+			PaintOrderRemover(optimized_tree).calculate_paint_order()
 		end_step2 = time.time()
-		self.timing_info['optimize_tree'] = end_step2 - start_step2
+		self.timing_info['calculate_paint_order'] = end_step2 - start_step2
 
 		# Step 3: Apply bounding box filtering (NEW)
 		if self.enable_bbox_filtering and optimized_tree:
@@ -407,7 +420,9 @@ class DOMTreeSerializer:
 	def _is_interactive_cached(self, node: EnhancedDOMTreeNode) -> bool:
 		"""Cached version of clickable element detection to avoid redundant calls."""
 		if node.node_id not in self._clickable_cache:
-			import time
+			if not self._collect_timing:
+				self._clickable_cache[node.node_id] = ClickableElementDetector.is_interactive(node)
+				return self._clickable_cache[node.node_id]
 
 			start_time = time.time()
 			result = ClickableElementDetector.is_interactive(node)
@@ -421,78 +436,87 @@ class DOMTreeSerializer:
 
 		return self._clickable_cache[node.node_id]
 
-	def _create_simplified_tree(self, node: EnhancedDOMTreeNode, depth: int = 0) -> SimplifiedNode | None:
-		"""Step 1: Create a simplified tree with enhanced element detection."""
+	def _create_simplified_tree(self, root: EnhancedDOMTreeNode) -> SimplifiedNode | None:
+		"""Step 1: Create a simplified tree with enhanced element detection.
+
+		Nodes are pruned on the way back up (post-order), so a returned node is always meaningful:
+		visible, scrollable, text, or with meaningful children. No separate optimization pass is needed.
+		The walk uses an explicit stack so deep pages do not hit the recursion limit.
+		"""
+		opened = self._open_simplified_node(root)
+		if opened is None or isinstance(opened, SimplifiedNode):
+			return opened
+
+		# Frames are (dom node, kept simplified children, dom children still to visit, open-time decision).
+		# A SimplifiedNode is only allocated once a node is known to be kept.
+		stack: list[tuple[EnhancedDOMTreeNode, list[SimplifiedNode], Iterator[EnhancedDOMTreeNode], _OpenDecision]] = [
+			(root, [], iter(opened[0]), opened)
+		]
+		result: SimplifiedNode | None = None
+
+		while stack:
+			node, kept_children, children, decision = stack[-1]
+			child = next(children, None)
+			if child is not None:
+				opened = self._open_simplified_node(child)
+				if opened is None:
+					continue
+				if not isinstance(opened, SimplifiedNode):
+					stack.append((child, [], iter(opened[0]), opened))
+					continue
+				finished = opened
+			else:
+				stack.pop()
+				finished = self._close_simplified_node(node, kept_children, decision)
+
+			if finished is None:
+				continue
+			if not stack:
+				result = finished
+				break
+
+			parent_node, parent_kept_children, _, parent_decision = stack[-1]
+			parent_kept_children.append(finished)
+			if parent_node.node_type == NodeType.DOCUMENT_NODE:
+				# A document is replaced by its first meaningful child, stop visiting the rest
+				stack[-1] = (parent_node, parent_kept_children, iter(()), parent_decision)
+
+		return result
 
+	def _open_simplified_node(self, node: EnhancedDOMTreeNode) -> SimplifiedNode | _OpenDecision | None:
+		"""Pre-order half of step 1: decide whether to descend into a node.
+
+		Returns None to skip the node, a finished leaf SimplifiedNode, or an _OpenDecision holding the
+		children to visit first plus the facts the post-order half needs, so nothing is evaluated twice.
+		"""
 		if node.node_type == NodeType.DOCUMENT_NODE:
 			# for all cldren including shadow roots
-			for child in node.children_and_shadow_roots:
-				simplified_child = self._create_simplified_tree(child, depth + 1)
-				if simplified_child:
-					return simplified_child
-
-			return None
+			return node.children_and_shadow_roots, None, None
 
 		if node.node_type == NodeType.DOCUMENT_FRAGMENT_NODE:
 			# ENHANCED shadow DOM processing - always include shadow content
-			simplified = SimplifiedNode(original_node=node, children=[])
-			for child in node.children_and_shadow_roots:
-				simplified_child = self._create_simplified_tree(child, depth + 1)
-				if simplified_child:
-					simplified.children.append(simplified_child)
-
-			# Always return shadow DOM fragments, even if children seem empty
-			# Shadow DOM often contains the actual interactive content in SPAs
-			return simplified if simplified.children else SimplifiedNode(original_node=node, children=[])
+			return node.children_and_shadow_roots, None, None
 
 		elif node.node_type == NodeType.ELEMENT_NODE:
 			# Skip non-content elements
-			if node.node_name.lower() in DISABLED_ELEMENTS:
+			if node.tag_name in DISABLED_ELEMENTS:
 				return None
 
 			if node.node_name == 'IFRAME' or node.node_name == 'FRAME':
 				if node.content_document:
-					simplified = SimplifiedNode(original_node=node, children=[])
-					for child in node.content_document.children_nodes or []:
-						simplified_child = self._create_simplified_tree(child, depth + 1)
-						if simplified_child is not None:
-							simplified.children.append(simplified_child)
-					return simplified
-
-			is_visible = node.is_visible
-			is_scrollable = node.is_actually_scrollable
-			has_shadow_content = bool(node.children_and_shadow_roots)
-
-			# ENHANCED SHADOW DOM DETECTION: Include shadow hosts even if not visible
-			is_shadow_host = any(child.node_type == NodeType.DOCUMENT_FRAGMENT_NODE for child in node.children_and_shadow_roots)
-
-			# Override visibility for elements with validation attributes
-			if not is_visible and node.attributes:
-				has_validation_attrs = any(attr.startswith(('aria-', 'pseudo')) for attr in node.attributes.keys())
-				if has_validation_attrs:
-					is_visible = True  # Force visibility for validation elements
-
-			# Include if visible, scrollable, has children, or is shadow host
-			if is_visible or is_scrollable or has_shadow_content or is_shadow_host:
-				simplified = SimplifiedNode(original_node=node, children=[], is_shadow_host=is_shadow_host)
-
-				# Process ALL children including shadow roots with enhanced logging
-				for child in node.children_and_shadow_roots:
-					simplified_child = self._create_simplified_tree(child, depth + 1)
-					if simplified_child:
-						simplified.children.append(simplified_child)
-
-				# COMPOUND CONTROL PROCESSING: Add virtual components for compound controls
-				self._add_compound_components(simplified, node)
-
-				# SHADOW DOM SPECIAL CASE: Always include shadow hosts even if not visible
-				# Many SPA frameworks (React, Vue) render content in shadow DOM
-				if is_shadow_host and simplified.children:
-					return simplified
-
-				# Return if meaningful or has meaningful children
-				if is_visible or is_scrollable or simplified.children:
-					return simplified
+					return node.content_document.children_nodes or [], None, None
+
+			children = node.children_and_shadow_roots
+
+			# Include if it has children (shadow hosts always have children), is visible, or is scrollable.
+			# With children the visibility/scroll checks are left for the post-order half, which skips
+			# them entirely when a child is kept.
+			if children:
+				# ENHANCED SHADOW DOM DETECTION: Include shadow hosts even if not visible
+				is_shadow_host = any(child.node_type == NodeType.DOCUMENT_FRAGMENT_NODE for child in children)
+				return children, None, is_shadow_host
+			if self._is_meaningful_node(node):
+				return children, True, False
 
 		elif node.node_type == NodeType.TEXT_NODE:
 			# Include meaningful text nodes
@@ -502,75 +526,107 @@ class DOMTreeSerializer:
 
 		return None
 
-	def _optimize_tree(self, node: SimplifiedNode | None) -> SimplifiedNode | None:
-		"""Step 2: Optimize tree structure."""
-		if not node:
-			return None
+	def _close_simplified_node(
+		self, node: EnhancedDOMTreeNode, kept_children: list[SimplifiedNode], decision: _OpenDecision
+	) -> SimplifiedNode | None:
+		"""Post-order half of step 1: build a node once its children are known, or prune it."""
+		if node.node_type == NodeType.DOCUMENT_NODE:
+			return kept_children[0] if kept_children else None
+
+		_, is_meaningful, is_shadow_host = decision
 
-		# Process children
-		optimized_children = []
-		for child in node.children:
-			optimized_child = self._optimize_tree(child)
-			if optimized_child:
-				optimized_children.append(optimized_child)
+		# Keep if meaningful or has meaningful children
+		# (Many SPA frameworks render content in shadow DOM, so invisible shadow hosts and roots with content are kept)
+		if not kept_children:
+			if is_meaningful is None:
+				is_meaningful = self._is_meaningful_node(node)
+			if not is_meaningful:
+				return None
 
-		node.children = optimized_children
+		if is_shadow_host is None:
+			# Shadow roots and frames with a content document
+			return SimplifiedNode(original_node=node, children=kept_children)
 
-		# Keep meaningful nodes
-		is_visible = node.original_node.snapshot_node and node.original_node.is_visible
+		simplified = SimplifiedNode(original_node=node, children=kept_children, is_shadow_host=is_shadow_host)
 
-		if (
-			is_visible  # Keep all visible nodes
-			or node.original_node.is_actually_scrollable
-			or node.original_node.node_type == NodeType.TEXT_NODE
-			or node.children
-		):
-			return node
+		# COMPOUND CONTROL PROCESSING: Add virtual components for compound controls
+		self._add_compound_components(simplified, node)
 
-		return None
+		return simplified
+
+	@staticmethod
+	def _is_meaningful_node(node: EnhancedDOMTreeNode) -> bool:
+		"""Visible or scrollable; cheapest check first, the scroll detection reads rects and computed styles."""
+		return bool(node.snapshot_node and node.is_visible) or node.is_actually_scrollable
 
 	def _collect_interactive_elements(self, node: SimplifiedNode, elements: list[SimplifiedNode]) -> None:
-		"""Recursively collect interactive elements that are also visible."""
-		is_interactive = self._is_interactive_cached(node.original_node)
-		is_visible = node.original_node.snapshot_node and node.original_node.is_visible
+		"""Collect interactive elements that are also visible, in document order."""
+		stack = [node]
+		while stack:
+			current = stack.pop()
+			is_visible = current.original_node.snapshot_node and current.original_node.is_visible
 
-		# Only collect elements that are both interactive AND visible
-		if is_interactive and is_visible:
-			elements.append(node)
+			# Only collect elements that are both interactive AND visible, checking the cheap visibility first
+			if is_visible and self._is_interactive_cached(current.original_node):
+				elements.append(current)
 
-		for child in node.children:
-			self._collect_interactive_elements(child, elements)
+			stack.extend(reversed(current.children))
 
 	def _assign_interactive_indices_and_mark_new_nodes(self, node: SimplifiedNode | None) -> None:
 		"""Assign interactive indices to clickable elements that are also visible."""
 		if not node:
 			return
 
-		# Skip assigning index to excluded nodes, or ignored by paint order
-		if not node.excluded_by_parent and not node.ignored_by_paint_order:
-			# Regular interactive element assignment (including enhanced compound controls)
-			is_interactive_assign = self._is_interactive_cached(node.original_node)
-			is_visible = node.original_node.snapshot_node and node.original_node.is_visible
-
-			# Only add to selector map if element is both interactive AND visible
-			if is_interactive_assign and is_visible:
-				node.interactive_index = self._interactive_counter
-				node.original_node.element_index = self._interactive_counter
-				self._selector_map[self._interactive_counter] = node.original_node
-				self._interactive_counter += 1
-
-				# Mark compound components as new for visibility
-				if node.is_compound_component:
+		# Pre-order walk with an explicit stack; children are pushed reversed to keep document order
+		candidates: list[SimplifiedNode] = []
+		stack = [node]
+		while stack:
+			node = stack.pop()
+
+			# Skip assigning index to excluded nodes, or ignored by paint order, or invisible
+			if (
+				not node.excluded_by_parent
+				and not node.ignored_by_paint_order
+				and node.original_node.snapshot_node
+				and node.original_node.is_visible
+			):
+				candidates.append(node)
+
+			# Process children
+			stack.extend(reversed(node.children))
+
+		# Regular interactive element detection (including enhanced compound controls), classified in one batch
+		start_time = time.time()
+		self._clickable_cache.update(
+			ClickableElementDetector.classify_batch(
+				candidate.original_node
+				for candidate in candidates
+				if candidate.original_node.node_id not in self._clickable_cache
+			)
+		)
+		self.timing_info['clickable_detection_time'] = time.time() - start_time
+
+		# Only add to selector map if element is both interactive AND visible
+		interactive_nodes = [node for node in candidates if self._clickable_cache[node.original_node.node_id]]
+		first_index = self._interactive_counter
+
+		for index, node in enumerate(interactive_nodes, start=first_index):
+			node.interactive_index = index
+			node.original_node.element_index = index
+
+			# Mark compound components as new for visibility
+			if node.is_compound_component:
+				node.is_new = True
+			elif self._previous_cached_selector_map:
+				# Check if node is new for regular elements
+				if node.original_node.backend_node_id not in self._previous_backend_ids:
 					node.is_new = True
-				elif self._previous_cached_selector_map:
-					# Check if node is new for regular elements
-					previous_backend_node_ids = {node.backend_node_id for node in self._previous_cached_selector_map.values()}
-					if node.original_node.backend_node_id not in previous_backend_node_ids:
-						node.is_new = True
 
-		# Process children
-		for child in node.children:
-			self._assign_interactive_indices_and_mark_new_nodes(child)
+		# Indices are consecutive, so the selector map is filled in one bulk update
+		self._selector_map.update(
+			zip(range(first_index, first_index + len(interactive_nodes)), (node.original_node for node in interactive_nodes))
+		)
+		self._interactive_counter = first_index + len(interactive_nodes)
 
 	def _apply_bounding_box_filtering(self, node: SimplifiedNode | None) -> SimplifiedNode | None:
 		"""Filter children contained within propagating parent bounds."""
@@ -591,40 +647,43 @@ class DOMTreeSerializer:
 
 	def _filter_tree_recursive(self, node: SimplifiedNode, active_bounds: PropagatingBounds | None = None, depth: int = 0):
 		"""
-		Recursively filter tree with bounding box propagation.
+		Filter tree with bounding box propagation, walking it with an explicit stack.
 		Bounds propagate to ALL descendants until overridden.
 		"""
+		stack: list[tuple[SimplifiedNode, PropagatingBounds | None, int]] = [(node, active_bounds, depth)]
+		while stack:
+			node, active_bounds, depth = stack.pop()
+
+			# Check if this node should be excluded by active bounds
+			if active_bounds and self._should_exclude_child(node, active_bounds):
+				node.excluded_by_parent = True
+				# Important: Still check if this node starts NEW propagation
+
+			# Check if this node starts new propagation (even if excluded!)
+			new_bounds = None
+			tag = node.original_node.tag_name.lower()
+			role = node.original_node.attributes.get('role') if node.original_node.attributes else None
+			attributes = {
+				'tag': tag,
+				'role': role,
+			}
+			# Check if this element matches any propagating element pattern
+			if self._is_propagating_element(attributes):
+				# This node propagates bounds to ALL its descendants
+				if node.original_node.snapshot_node and node.original_node.snapshot_node.bounds:
+					new_bounds = PropagatingBounds(
+						tag=tag,
+						bounds=node.original_node.snapshot_node.bounds,
+						node_id=node.original_node.node_id,
+						depth=depth,
+					)
 
-		# Check if this node should be excluded by active bounds
-		if active_bounds and self._should_exclude_child(node, active_bounds):
-			node.excluded_by_parent = True
-			# Important: Still check if this node starts NEW propagation
-
-		# Check if this node starts new propagation (even if excluded!)
-		new_bounds = None
-		tag = node.original_node.tag_name.lower()
-		role = node.original_node.attributes.get('role') if node.original_node.attributes else None
-		attributes = {
-			'tag': tag,
-			'role': role,
-		}
-		# Check if this element matches any propagating element pattern
-		if self._is_propagating_element(attributes):
-			# This node propagates bounds to ALL its descendants
-			if node.original_node.snapshot_node and node.original_node.snapshot_node.bounds:
-				new_bounds = PropagatingBounds(
-					tag=tag,
-					bounds=node.original_node.snapshot_node.bounds,
-					node_id=node.original_node.node_id,
-					depth=depth,
-				)
-
-		# Propagate to ALL children
-		# Use new_bounds if this node starts propagation, otherwise continue with active_bounds
-		propagate_bounds = new_bounds if new_bounds else active_bounds
+			# Propagate to ALL children
+			# Use new_bounds if this node starts propagation, otherwise continue with active_bounds
+			propagate_bounds = new_bounds if new_bounds else active_bounds
 
-		for child in node.children:
-			self._filter_tree_recursive(child, propagate_bounds, depth + 1)
+			for child in reversed(node.children):
+				stack.append((child, propagate_bounds, depth + 1))
 
 	def _should_exclude_child(self, node: SimplifiedNode, active_bounds: PropagatingBounds) -> bool:
 		"""
@@ -705,10 +764,14 @@ class DOMTreeSerializer:
 
 	def _count_excluded_nodes(self, node: SimplifiedNode, count: int = 0) -> int:
 		"""Count how many nodes were excluded (for debugging)."""
-		if hasattr(node, 'excluded_by_parent') and node.excluded_by_parent:
-			count += 1
-		for child in node.children:
-			count = self._count_excluded_nodes(child, count)
+		# Iterative walk: deep DOMs would otherwise pay a Python frame per node
+		stack = [node]
+		while stack:
+			current = stack.pop()
+			if current.excluded_by_parent:
+				count += 1
+			if current.children:
+				stack.extend(current.children)
 		return count
 
 	def _is_propagating_element(self, attributes: dict[str, str | None]) -> bool:
@@ -727,169 +790,218 @@ class DOMTreeSerializer:
 
 	@staticmethod
 	def serialize_tree(node: SimplifiedNode | None, include_attributes: list[str], depth: int = 0) -> str:
-		"""Serialize the optimized tree to string format."""
+		"""Serialize the optimized tree to string format.
+
+		Walks the tree with an explicit stack into one flat list of lines that is joined once at the end.
+		"""
 		if not node:
 			return ''
 
-		# Skip rendering excluded nodes, but process their children
-		if hasattr(node, 'excluded_by_parent') and node.excluded_by_parent:
-			formatted_text = []
-			for child in node.children:
-				child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, depth)
-				if child_text:
-					formatted_text.append(child_text)
-			return '\n'.join(formatted_text)
-
-		formatted_text = []
-		depth_str = depth * '\t'
-		next_depth = depth
-
-		if node.original_node.node_type == NodeType.ELEMENT_NODE:
-			# Skip displaying nodes marked as should_display=False
-			if not node.should_display:
-				for child in node.children:
-					child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, depth)
-					if child_text:
-						formatted_text.append(child_text)
-				return '\n'.join(formatted_text)
-
-			# Add element with interactive_index if clickable, scrollable, or iframe
-			is_any_scrollable = node.original_node.is_actually_scrollable or node.original_node.is_scrollable
-			should_show_scroll = node.original_node.should_show_scroll_info
-			if (
-				node.interactive_index is not None
-				or is_any_scrollable
-				or node.original_node.tag_name.upper() == 'IFRAME'
-				or node.original_node.tag_name.upper() == 'FRAME'
-			):
-				next_depth += 1
-
-				# Build attributes string with compound component info
-				text_content = ''
-				attributes_html_str = DOMTreeSerializer._build_attributes_string(
-					node.original_node, include_attributes, text_content
-				)
+		lines: list[str] = []
+		# Attribute strings of identical-looking elements (e.g. table cells), shared within this call
+		attributes_cache: dict[tuple, str] = {}
+		# Membership tests against the include list happen for every attribute of every element
+		include_set = frozenset(include_attributes)
+		# Stack items are (node, depth) pairs, or a ready-made line emitted after a subtree (shadow end marker)
+		stack: list[tuple[SimplifiedNode, int] | str] = [(node, depth)]
+
+		while stack:
+			item = stack.pop()
+			if isinstance(item, str):
+				lines.append(item)
+				continue
+
+			node, depth = item
+
+			# Skip rendering excluded nodes, but process their children
+			if node.excluded_by_parent:
+				stack.extend((child, depth) for child in reversed(node.children))
+				continue
+
+			depth_str = _INDENT[depth] if depth < 64 else '\t' * depth
+			next_depth = depth
+
+			if node.original_node.node_type == NodeType.ELEMENT_NODE:
+				# Skip displaying nodes marked as should_display=False
+				if not node.should_display:
+					stack.extend((child, depth) for child in reversed(node.children))
+					continue
 
-				# Add compound component information to attributes if present
-				if node.original_node._compound_children:
-					compound_info = []
-					for child_info in node.original_node._compound_children:
-						parts = []
-						if child_info['name']:
-							parts.append(f'name={child_info["name"]}')
-						if child_info['role']:
-							parts.append(f'role={child_info["role"]}')
-						if child_info['valuemin'] is not None:
-							parts.append(f'min={child_info["valuemin"]}')
-						if child_info['valuemax'] is not None:
-							parts.append(f'max={child_info["valuemax"]}')
-						if child_info['valuenow'] is not None:
-							parts.append(f'current={child_info["valuenow"]}')
-
-						# Add select-specific information
-						if 'options_count' in child_info and child_info['options_count'] is not None:
-							parts.append(f'count={child_info["options_count"]}')
-						if 'first_options' in child_info and child_info['first_options']:
-							options_str = '|'.join(child_info['first_options'][:4])  # Limit to 4 options
-							parts.append(f'options={options_str}')
-						if 'format_hint' in child_info and child_info['format_hint']:
-							parts.append(f'format={child_info["format_hint"]}')
-
-						if parts:
-							compound_info.append(f'({",".join(parts)})')
-
-					if compound_info:
-						compound_attr = f'compound_components={",".join(compound_info)}'
-						if attributes_html_str:
-							attributes_html_str += f' {compound_attr}'
-						else:
-							attributes_html_str = compound_attr
-
-				# Build the line with shadow host indicator
-				shadow_prefix = ''
-				if node.is_shadow_host:
-					# Check if any shadow children are closed
-					has_closed_shadow = any(
-						child.original_node.node_type == NodeType.DOCUMENT_FRAGMENT_NODE
-						and child.original_node.shadow_root_type
-						and child.original_node.shadow_root_type.lower() == 'closed'
-						for child in node.children
+				# Add element with interactive_index if clickable, scrollable, or iframe
+				if (
+					node.interactive_index is not None
+					or node.original_node.is_scrollable
+					or node.original_node.is_actually_scrollable
+					or node.original_node.tag_name.upper() == 'IFRAME'
+					or node.original_node.tag_name.upper() == 'FRAME'
+				):
+					next_depth += 1
+					lines.append(
+						DOMTreeSerializer._serialize_element_line(
+							node, include_attributes, depth_str, attributes_cache, include_set
+						)
 					)
-					shadow_prefix = '|SHADOW(closed)|' if has_closed_shadow else '|SHADOW(open)|'
-
-				if should_show_scroll and node.interactive_index is None:
-					# Scrollable container but not clickable
-					line = f'{depth_str}{shadow_prefix}|SCROLL|<{node.original_node.tag_name}'
-				elif node.interactive_index is not None:
-					# Clickable (and possibly scrollable)
-					new_prefix = '*' if node.is_new else ''
-					scroll_prefix = '|SCROLL+' if should_show_scroll else '['
-					line = f'{depth_str}{shadow_prefix}{new_prefix}{scroll_prefix}{node.interactive_index}]<{node.original_node.tag_name}'
-				elif node.original_node.tag_name.upper() == 'IFRAME':
-					# Iframe element (not interactive)
-					line = f'{depth_str}{shadow_prefix}|IFRAME|<{node.original_node.tag_name}'
-				elif node.original_node.tag_name.upper() == 'FRAME':
-					# Frame element (not interactive)
-					line = f'{depth_str}{shadow_prefix}|FRAME|<{node.original_node.tag_name}'
+
+			elif node.original_node.node_type == NodeType.DOCUMENT_FRAGMENT_NODE:
+				# Shadow DOM representation - show clearly to LLM
+				if node.original_node.shadow_root_type and node.original_node.shadow_root_type.lower() == 'closed':
+					lines.append(f'{depth_str}▼ Shadow Content (Closed)')
 				else:
-					line = f'{depth_str}{shadow_prefix}<{node.original_node.tag_name}'
+					lines.append(f'{depth_str}▼ Shadow Content (Open)')
 
-				if attributes_html_str:
-					line += f' {attributes_html_str}'
+				next_depth += 1
 
-				line += ' />'
+				# Close shadow DOM indicator, emitted after the shadow DOM children
+				if node.children:  # Only show close if we had content
+					stack.append(f'{depth_str}▲ Shadow Content End')
 
-				# Add scroll information only when we should show it
-				if should_show_scroll:
-					scroll_info_text = node.original_node.get_scroll_info_text()
-					if scroll_info_text:
-						line += f' ({scroll_info_text})'
+			elif node.original_node.node_type == NodeType.TEXT_NODE:
+				# Include visible text
+				is_visible = node.original_node.snapshot_node and node.original_node.is_visible
+				if (
+					is_visible
+					and node.original_node.node_value
+					and node.original_node.node_value.strip()
+					and len(node.original_node.node_value.strip()) > 1
+				):
+					clean_text = node.original_node.node_value.strip()
+					lines.append(f'{depth_str}{clean_text}')
 
-				formatted_text.append(line)
+			# Process children, reversed so they pop in document order
+			stack.extend((child, next_depth) for child in reversed(node.children))
 
-		elif node.original_node.node_type == NodeType.DOCUMENT_FRAGMENT_NODE:
-			# Shadow DOM representation - show clearly to LLM
-			if node.original_node.shadow_root_type and node.original_node.shadow_root_type.lower() == 'closed':
-				formatted_text.append(f'{depth_str}▼ Shadow Content (Closed)')
-			else:
-				formatted_text.append(f'{depth_str}▼ Shadow Content (Open)')
+		return '\n'.join(lines)
 
-			next_depth += 1
+	@staticmethod
+	def _serialize_element_line(
+		node: SimplifiedNode,
+		include_attributes: list[str],
+		depth_str: str,
+		attributes_cache: dict[tuple, str] | None = None,
+		include_set: frozenset[str] | None = None,
+	) -> str:
+		"""Format the single line shown for an indexed, scrollable or frame element."""
+		should_show_scroll = node.original_node.should_show_scroll_info
+
+		# Build attributes string with compound component info
+		text_content = ''
+		cache_key = DOMTreeSerializer._attributes_cache_key(node.original_node) if attributes_cache is not None else None
+		if attributes_cache is not None and cache_key is not None:
+			attributes_html_str = attributes_cache.get(cache_key)
+			if attributes_html_str is None:
+				attributes_html_str = DOMTreeSerializer._build_attributes_string(
+					node.original_node, include_attributes, text_content, include_set
+				)
+				attributes_cache[cache_key] = attributes_html_str
+		else:
+			attributes_html_str = DOMTreeSerializer._build_attributes_string(
+				node.original_node, include_attributes, text_content, include_set
+			)
 
-			# Process shadow DOM children
-			for child in node.children:
-				child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, next_depth)
-				if child_text:
-					formatted_text.append(child_text)
+		# Add compound component information to attributes if present
+		if node.original_node._compound_children:
+			compound_info = []
+			for child_info in node.original_node._compound_children:
+				parts = []
+				if child_info['name']:
+					parts.append(f'name={child_info["name"]}')
+				if child_info['role']:
+					parts.append(f'role={child_info["role"]}')
+				if child_info['valuemin'] is not None:
+					parts.append(f'min={child_info["valuemin"]}')
+				if child_info['valuemax'] is not None:
+					parts.append(f'max={child_info["valuemax"]}')
+				if child_info['valuenow'] is not None:
+					parts.append(f'current={child_info["valuenow"]}')
+
+				# Add select-specific information
+				if 'options_count' in child_info and child_info['options_count'] is not None:
+					parts.append(f'count={child_info["options_count"]}')
+				if 'first_options' in child_info and child_info['first_options']:
+					options_str = '|'.join(child_info['first_options'][:4])  # Limit to 4 options
+					parts.append(f'options={options_str}')
+				if 'format_hint' in child_info and child_info['format_hint']:
+					parts.append(f'format={child_info["format_hint"]}')
+
+				if parts:
+					compound_info.append(f'({",".join(parts)})')
+
+			if compound_info:
+				compound_attr = f'compound_components={",".join(compound_info)}'
+				if attributes_html_str:
+					attributes_html_str += f' {compound_attr}'
+				else:
+					attributes_html_str = compound_attr
+
+		# Build the line with shadow host indicator
+		shadow_prefix = ''
+		if node.is_shadow_host:
+			# Check if any shadow children are closed
+			has_closed_shadow = any(
+				child.original_node.node_type == NodeType.DOCUMENT_FRAGMENT_NODE
+				and child.original_node.shadow_root_type
+				and child.original_node.shadow_root_type.lower() == 'closed'
+				for child in node.children
+			)
+			shadow_prefix = '|SHADOW(closed)|' if has_closed_shadow else '|SHADOW(open)|'
+
+		if should_show_scroll and node.interactive_index is None:
+			# Scrollable container but not clickable
+			line = f'{depth_str}{shadow_prefix}|SCROLL|<{node.original_node.tag_name}'
+		elif node.interactive_index is not None:
+			# Clickable (and possibly scrollable)
+			new_prefix = '*' if node.is_new else ''
+			scroll_prefix = '|SCROLL+' if should_show_scroll else '['
+			line = f'{depth_str}{shadow_prefix}{new_prefix}{scroll_prefix}{node.interactive_index}]<{node.original_node.tag_name}'
+		elif node.original_node.tag_name.upper() == 'IFRAME':
+			# Iframe element (not interactive)
+			line = f'{depth_str}{shadow_prefix}|IFRAME|<{node.original_node.tag_name}'
+		elif node.original_node.tag_name.upper() == 'FRAME':
+			# Frame element (not interactive)
+			line = f'{depth_str}{shadow_prefix}|FRAME|<{node.original_node.tag_name}'
+		else:
+			line = f'{depth_str}{shadow_prefix}<{node.original_node.tag_name}'
 
-			# Close shadow DOM indicator
-			if node.children:  # Only show close if we had content
-				formatted_text.append(f'{depth_str}▲ Shadow Content End')
+		if attributes_html_str:
+			line += f' {attributes_html_str}'
 
-		elif node.original_node.node_type == NodeType.TEXT_NODE:
-			# Include visible text
-			is_visible = node.original_node.snapshot_node and node.original_node.is_visible
-			if (
-				is_visible
-				and node.original_node.node_value
-				and node.original_node.node_value.strip()
-				and len(node.original_node.node_value.strip()) > 1
-			):
-				clean_text = node.original_node.node_value.strip()
-				formatted_text.append(f'{depth_str}{clean_text}')
+		line += ' />'
+
+		# Add scroll information only when we should show it
+		if should_show_scroll:
+			scroll_info_text = node.original_node.get_scroll_info_text()
+			if scroll_info_text:
+				line += f' ({scroll_info_text})'
 
-		# Process children (for non-shadow elements)
-		if node.original_node.node_type != NodeType.DOCUMENT_FRAGMENT_NODE:
-			for child in node.children:
-				child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, next_depth)
-				if child_text:
-					formatted_text.append(child_text)
+		return line
 
-		return '\n'.join(formatted_text)
+	@staticmethod
+	def _attributes_cache_key(node: EnhancedDOMTreeNode) -> tuple | None:
+		"""Everything _build_attributes_string reads from a node, or None when it cannot be hashed."""
+		ax_node = node.ax_node
+		ax_properties = tuple((prop.name, prop.value) for prop in ax_node.properties) if ax_node and ax_node.properties else ()
+		key = (
+			node.node_name,
+			ax_node.role if ax_node else None,
+			tuple(node.attributes.items()) if node.attributes else (),
+			ax_properties,
+		)
+		try:
+			hash(key)
+		except TypeError:
+			return None
+		return key
 
 	@staticmethod
-	def _build_attributes_string(node: EnhancedDOMTreeNode, include_attributes: list[str], text: str) -> str:
-		"""Build the attributes string for an element."""
+	def _build_attributes_string(
+		node: EnhancedDOMTreeNode, include_attributes: list[str], text: str, include_set: frozenset[str] | None = None
+	) -> str:
+		"""Build the attributes string for an element.
+
+		include_set is include_attributes as a set for fast lookups; it is built here when not passed in.
+		"""
+		if include_set is None:
+			include_set = frozenset(include_attributes)
 		attributes_to_include = {}
 
 		# Include HTML attributes
@@ -898,7 +1010,7 @@ class DOMTreeSerializer:
 				{
 					key: str(value).strip()
 					for key, value in node.attributes.items()
-					if key in include_attributes and str(value).strip() != ''
+					if key in include_set and str(value).strip() != ''
 				}
 			)
 
@@ -906,7 +1018,7 @@ class DOMTreeSerializer:
 		if node.ax_node and node.ax_node.properties:
 			for prop in node.ax_node.properties:
 				try:
-					if prop.name in include_attributes and prop.value is not None:
+					if prop.name in include_set and prop.value is not None:
 						# Convert boolean to lowercase string, keep others as-is
 						if isinstance(prop.value, bool):
 							attributes_to_include[prop.name] = str(prop.value).lower()
@@ -920,10 +1032,11 @@ class DOMTreeSerializer:
 		if not attributes_to_include:
 			return ''
 
-		# Remove duplicate values
-		ordered_keys = [key for key in include_attributes if key in attributes_to_include]
-
-		if len(ordered_keys) > 1:
+		# Remove duplicate values (only values longer than 5 characters count as duplicates)
+		# Most elements have no such duplicates, so check that before building the ordered key list
+		long_values = [value for value in attributes_to_include.values() if len(value) > 5]
+		if len(long_values) > 1 and len(set(long_values)) < len(long_values):
+			ordered_keys = [key for key in include_attributes if key in attributes_to_include]
 			keys_to_remove = set()
 			seen_values = {}
 
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import sys
 import time
 from typing import TYPE_CHECKING
 
@@ -544,7 +545,8 @@ class DomService:
 				node_id=node['nodeId'],
 				backend_node_id=node['backendNodeId'],
 				node_type=NodeType(node['nodeType']),
-				node_name=node['nodeName'],
+				# Tag names repeat across thousands of nodes; interning shares one string per name
+				node_name=sys.intern(node['nodeName']),
 				node_value=node['nodeValue'],
 				attributes=attributes or {},
 				is_scrollable=node.get('isScrollable', None),
@@ -1,4 +1,5 @@
 import hashlib
+import sys
 from dataclasses import asdict, dataclass, field
 from enum import Enum
 from typing import Any
@@ -383,6 +384,15 @@ class EnhancedDOMTreeNode:
 
 	uuid: str = field(default_factory=uuid7str)
 
+	# Memoized parent_branch_hash(); the parent chain is fixed once the tree is built
+	_parent_branch_hash: int | None = field(default=None, repr=False, compare=False)
+
+	# Memoized tag_name; node_name does not change once the node is built
+	_tag_name: str | None = field(default=None, repr=False, compare=False)
+
+	# Memoized is_actually_scrollable; it is read several times per node during serialization
+	_actually_scrollable: bool | None = field(default=None, repr=False, compare=False)
+
 	@property
 	def parent(self) -> 'EnhancedDOMTreeNode | None':
 		return self.parent_node
@@ -398,12 +408,15 @@ class EnhancedDOMTreeNode:
 		"""
 		children = self.children_nodes or []
 		if self.shadow_roots:
-			children.extend(self.shadow_roots)
+			# Build a new list: extending children_nodes in place made every call append the shadow roots again
+			return children + self.shadow_roots
 		return children
 
 	@property
 	def tag_name(self) -> str:
-		return self.node_name.lower()
+		if self._tag_name is None:
+			self._tag_name = sys.intern(self.node_name.lower())
+		return self._tag_name
 
 	@property
 	def xpath(self) -> str:
@@ -545,6 +558,11 @@ class EnhancedDOMTreeNode:
 		This detects scrollable elements that Chrome's CDP might miss, which is common
 		in iframes and dynamically sized containers.
 		"""
+		if self._actually_scrollable is None:
+			self._actually_scrollable = self._detect_actually_scrollable()
+		return self._actually_scrollable
+
+	def _detect_actually_scrollable(self) -> bool:
 		# First check if CDP already detected it as scrollable
 		if self.is_scrollable:
 			return True
@@ -773,11 +791,15 @@ class EnhancedDOMTreeNode:
 		"""
 		Hash the element based on its parent branch path and attributes.
 		"""
+		if self._parent_branch_hash is not None:
+			return self._parent_branch_hash
+
 		parent_branch_path = self._get_parent_branch_path()
 		parent_branch_path_string = '/'.join(parent_branch_path)
 		element_hash = hashlib.sha256(parent_branch_path_string.encode()).hexdigest()
 
-		return int(element_hash[:16], 16)
+		self._parent_branch_hash = int(element_hash[:16], 16)
+		return self._parent_branch_hash
 
 	def _get_parent_branch_path(self) -> list[str]:
 		"""Get the parent branch path as a list of tag names from root to current element."""
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import logging
 import sys
+import time
+from typing import TYPE_CHECKING, Any
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
-from browser_use.agent.views import ApprovalDecision, ApprovalResult
-from browser_use.gui.worker import AgentWorker, QtLogHandler, UserPreferences
+from browser_use.config import CONFIG
+from browser_use.gui.worker import AgentWorker, QtLogFormatter, QtLogHandler, UserPreferences, summarize_config
 from browser_use.gui.widgets import (
 	ExecutionTab,
 	HistoryTab,
@@ -15,17 +17,34 @@ from browser_use.gui.widgets import (
 	TaskInputPanel,
 )
 
+# agent.views は LLM SDK の型まで読み込むため、承認ダイアログを使う時点で読み込む
+if TYPE_CHECKING:
+	from browser_use.agent.views import ApprovalDecision
+
 
 class MainWindow(QtWidgets.QMainWindow):
+	LOG_DRAIN_INTERVAL_MS = 50
+	STEP_RENDER_INTERVAL_MS = 16
+
 	def __init__(self) -> None:
 		super().__init__()
 		self.setWindowTitle('use it')
 		self.resize(960, 720)
 
 		self._worker: AgentWorker | None = None
+		self._approval_dialog: ApprovalDialog | None = None
 		self._log_handler = QtLogHandler()
-		self._log_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-		self._log_handler.signal.connect(self._on_log_message)
+		self._log_handler.setFormatter(QtLogFormatter('%(asctime)s - %(levelname)s - %(message)s'))
+		# ログはハンドラ側でバッファし、GUIスレッドでまとめて描画する
+		self._log_timer = QtCore.QTimer(self)
+		self._log_timer.setInterval(self.LOG_DRAIN_INTERVAL_MS)
+		self._log_timer.timeout.connect(self._drain_log_messages)
+		# ステップ更新は最新のものだけを 1 フレームに 1 回描画する
+		self._pending_step_snapshot: dict | None = None
+		self._step_render_timer = QtCore.QTimer(self)
+		self._step_render_timer.setSingleShot(True)
+		self._step_render_timer.setInterval(self.STEP_RENDER_INTERVAL_MS)
+		self._step_render_timer.timeout.connect(self._render_pending_step)
 		self._handler_attached = False
 		self._closing_after_stop = False
 		self._history_entries: list[TaskHistoryEntry] = []
@@ -92,8 +111,22 @@ class MainWindow(QtWidgets.QMainWindow):
 			'タスクを入力して「実行」を押すと、エージェントがブラウザ操作を開始します。',
 		)
 
-	def _on_log_message(self, message: str) -> None:
-		self.execution_tab.log_panel.append_message(message)
+	def _drain_log_messages(self) -> None:
+		messages = self._log_handler.drain()
+		if messages:
+			self.execution_tab.log_panel.append_messages(messages)
+
+	def _queue_step_update(self, payload: dict) -> None:
+		self._pending_step_snapshot = payload
+		if not self._step_render_timer.isActive():
+			self._step_render_timer.start()
+
+	def _render_pending_step(self) -> None:
+		self._step_render_timer.stop()
+		payload = self._pending_step_snapshot
+		if payload is not None:
+			self._pending_step_snapshot = None
+			self.execution_tab.step_panel.update_snapshot(payload)
 
 	def _handle_approval_request(self, payload: dict) -> None:
 		worker = self._worker
@@ -101,9 +134,17 @@ class MainWindow(QtWidgets.QMainWindow):
 			return
 
 		self._update_status('ユーザーの承認を待機しています…')
-		dialog = ApprovalDialog(payload, parent=self)
+		# ダイアログはステップごとに作り直さず、1つを使い回す
+		dialog = self._approval_dialog
+		if dialog is None:
+			dialog = ApprovalDialog(payload, parent=self)
+			self._approval_dialog = dialog
+		else:
+			dialog.reset(payload)
 		dialog.exec()
 
+		from browser_use.agent.views import ApprovalResult
+
 		decision: ApprovalDecision = dialog.decision
 		result = ApprovalResult(decision=decision, feedback=dialog.feedback)
 		worker.submit_approval_result(result)
@@ -123,33 +164,50 @@ class MainWindow(QtWidgets.QMainWindow):
 			return
 
 		preferences = UserPreferences(task=task)
-		self._worker = AgentWorker(preferences)
-		self._update_info_panels_from_worker(self._worker)
-		self._bind_worker_signals(self._worker)
+		try:
+			worker = self._ensure_worker()
+		except Exception as exc:
+			QtWidgets.QMessageBox.critical(self, 'エラー', str(exc))
+			return
+		self._update_info_panels_from_worker(worker)
 		self._add_history_entry(task)
 		self.history_tab.browser_panel.set_status('実行中')
 		self._closing_after_stop = False
 		self.execution_tab.step_panel.clear()
 
 		root_logger = logging.getLogger()
-		if not any(handler is self._log_handler for handler in root_logger.handlers):
+		if not self._handler_attached:
 			root_logger.addHandler(self._log_handler)
 			self._handler_attached = True
 		root_logger.setLevel(logging.INFO)
+		self._log_handler.setLevel(logging.INFO)
+		self._log_timer.start()
 
 		logging.getLogger(__name__).info('タスク実行を開始します。')
 		self._update_controls(running=True)
-		self._worker.start()
+		worker.start_task(preferences)
+
+	def _ensure_worker(self) -> AgentWorker:
+		"""Return the app-wide worker, creating it (and binding its signals) on first use.
+
+		The worker keeps one event loop for the whole session, so later runs skip loop setup.
+		"""
+		if self._worker is None:
+			worker = AgentWorker(parent=self)
+			self._bind_worker_signals(worker)
+			self._worker = worker
+		return self._worker
 
 	def _bind_worker_signals(self, worker: AgentWorker) -> None:
 		worker.status.connect(self._update_status)
 		worker.progress.connect(self._update_progress)
 		worker.finished.connect(self._on_finished)
-		worker.step_update.connect(self.execution_tab.step_panel.update_snapshot)
+		worker.step_update.connect(self._queue_step_update)
 		worker.approval_requested.connect(self._handle_approval_request)
+		worker.config_reloaded.connect(self._update_info_panels)
 
 	def _stop_execution(self) -> None:
-		if self._worker is None:
+		if self._worker is None or not self._worker.is_busy:
 			return
 
 		self._worker.request_cancel()
@@ -168,12 +226,15 @@ class MainWindow(QtWidgets.QMainWindow):
 
 	def _on_finished(self, success: bool, message: str) -> None:
 		root_logger = logging.getLogger()
-		if self._handler_attached and self._log_handler in root_logger.handlers:
+		if self._handler_attached:
+			# removeHandler は未登録でも何もしないので、リストを事前に調べる必要はない
 			root_logger.removeHandler(self._log_handler)
 			self._handler_attached = False
+		self._log_timer.stop()
+		self._drain_log_messages()
+		self._render_pending_step()
 
 		self._update_controls(running=False)
-		self._worker = None
 		self.history_tab.browser_panel.set_status('未接続')
 		self._finalize_history_entry(success, message)
 
@@ -194,7 +255,7 @@ class MainWindow(QtWidgets.QMainWindow):
 		self.task_panel.set_running_state(running)
 
 	def closeEvent(self, event: QtGui.QCloseEvent) -> None:  # noqa: N802
-		if self._worker is not None and self._worker.isRunning():
+		if self._worker is not None and self._worker.is_busy:
 			reply = QtWidgets.QMessageBox.question(
 				self,
 				'確認',
@@ -214,6 +275,8 @@ class MainWindow(QtWidgets.QMainWindow):
 			event.ignore()
 			return
 
+		if self._worker is not None:
+			self._worker.shutdown()
 		event.accept()
 
 	def _clear_logs(self) -> None:
@@ -223,10 +286,7 @@ class MainWindow(QtWidgets.QMainWindow):
 		entry = TaskHistoryEntry(task=task, status='実行中')
 		self._history_entries.insert(0, entry)
 		self._current_history_index = 0
-		self._refresh_history_list(select_index=0)
-
-	def _refresh_history_list(self, select_index: int | None = None) -> None:
-		self.history_tab.history_list.set_entries(self._history_entries, select_index=select_index)
+		self.history_tab.history_list.insert_entry(0, entry)
 
 	def _finalize_history_entry(self, success: bool, message: str) -> None:
 		if self._current_history_index is None:
@@ -236,7 +296,7 @@ class MainWindow(QtWidgets.QMainWindow):
 		except IndexError:
 			return
 
-		entry.finished_at = QtCore.QDateTime.currentDateTime()
+		entry.finished_at = time.time()
 		entry.result_summary = message
 		if success:
 			entry.status = '完了'
@@ -245,12 +305,11 @@ class MainWindow(QtWidgets.QMainWindow):
 		else:
 			entry.status = '失敗'
 
-		self._refresh_history_list(select_index=self._current_history_index)
-		if self._current_history_index is not None:
-			self.history_tab.history_list.set_current_row(self._current_history_index)
+		self.history_tab.history_list.update_entry(self._current_history_index, entry)
+		self.history_tab.history_list.set_current_row(self._current_history_index)
 
 	def _on_history_selection_changed(self) -> None:
-		if self._worker is not None and self._worker.isRunning():
+		if self._worker is not None and self._worker.is_busy:
 			return
 
 		row = self.history_tab.history_list.current_row()
@@ -264,18 +323,23 @@ class MainWindow(QtWidgets.QMainWindow):
 		self._update_status(f'[{entry.status}] {summary}')
 
 	def _update_info_panels_from_worker(self, worker: AgentWorker) -> None:
-		llm_summary = worker.llm_summary
-		browser_summary = worker.browser_summary
+		self._update_info_panels(worker.llm_summary, worker.browser_summary)
 
+	def _update_info_panels(self, llm_summary: dict[str, Any], browser_summary: dict[str, Any]) -> None:
 		self.history_tab.model_panel.update_summary(llm_summary)
 		self.history_tab.browser_panel.update_summary(browser_summary)
 
 	def _load_initial_panels(self) -> None:
+		# 起動時は設定ファイルの値だけで表示し、LLM クライアントやブラウザプロファイルの構築は最初の実行まで遅らせる
 		try:
-			worker = AgentWorker(UserPreferences(task=''))
-			self._update_info_panels_from_worker(worker)
+			raw_config = CONFIG.load_config()
 		except Exception as exc:
 			logging.getLogger(__name__).debug(f'初期情報パネルの読み込みに失敗しました: {exc}')
+			return
+
+		llm_summary, browser_summary = summarize_config(raw_config)
+		self.history_tab.model_panel.update_summary(llm_summary)
+		self.history_tab.browser_panel.update_summary(browser_summary)
 
 
 def main() -> None:
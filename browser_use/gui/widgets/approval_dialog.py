@@ -1,15 +1,97 @@
 from __future__ import annotations
 
-import base64
-from typing import Any
+import functools
+from typing import TYPE_CHECKING, Any
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
-from browser_use.agent.views import ApprovalDecision
+try:
+	import pybase64 as _base64  # type: ignore[import-not-found]  # SIMD デコーダ（gui 追加依存）。大きなスクリーンショットで速い
+except ImportError:
+	import base64 as _base64
+
+if TYPE_CHECKING:
+	from browser_use.agent.views import ApprovalDecision
+
+
+_SCREENSHOT_MAX_WIDTH = 640
+
+
+def _sniff_image_format(data: bytes) -> str | None:
+	"""Return the Qt image format name for common screenshot encodings, so Qt skips format probing."""
+	if data.startswith(b'\xff\xd8\xff'):
+		return 'JPG'
+	if data.startswith(b'\x89PNG'):
+		return 'PNG'
+	if data.startswith(b'RIFF') and data[8:12] == b'WEBP':
+		return 'WEBP'
+	return None
+
+
+@functools.lru_cache(maxsize=1)
+def _load_screenshot_pixmap(encoded: str) -> QtGui.QPixmap | None:
+	"""Decode and scale a base64 screenshot, or return None if it cannot be displayed.
+
+	Cached for the last screenshot: a 'retry' re-opens the dialog for the same browser state.
+	"""
+	data = encoded
+	if data.startswith('data:image'):
+		data = data.partition(',')[2] or data
+
+	try:
+		image_bytes = _base64.b64decode(data, validate=False)
+	except (ValueError, TypeError):
+		return None
+
+	image = _read_scaled_image(image_bytes, _SCREENSHOT_MAX_WIDTH)
+	if image.isNull():
+		# Some environments bundle Qt without JPEG support. Try decoding via Pillow.
+		try:
+			from io import BytesIO
+
+			from PIL import Image  # type: ignore
+		except Exception:
+			return None
+
+		try:
+			with Image.open(BytesIO(image_bytes)) as img:
+				rgba = img.convert('RGBA')
+				# Hand the decoded pixels to Qt directly instead of re-encoding them as PNG
+				image = QtGui.QImage(
+					rgba.tobytes('raw', 'RGBA'), rgba.width, rgba.height, QtGui.QImage.Format.Format_RGBA8888
+				).copy()
+		except Exception:
+			return None
+		if image.isNull():
+			return None
+		if image.width() > _SCREENSHOT_MAX_WIDTH:
+			image = image.scaledToWidth(_SCREENSHOT_MAX_WIDTH, QtCore.Qt.TransformationMode.SmoothTransformation)
+
+	return QtGui.QPixmap.fromImage(image)
+
+
+def _read_scaled_image(image_bytes: bytes, max_width: int) -> QtGui.QImage:
+	"""Decode straight to at most max_width pixels wide (a null image if Qt cannot decode it).
+
+	The JPEG reader scales inside the decoder, so a full-resolution screenshot is never materialized.
+	"""
+	buffer = QtCore.QBuffer()
+	buffer.setData(image_bytes)
+	buffer.open(QtCore.QIODevice.OpenModeFlag.ReadOnly)
+
+	image_format = _sniff_image_format(image_bytes)
+	reader = QtGui.QImageReader(buffer, image_format.encode() if image_format else b'')
+	size = reader.size()
+	if size.isValid() and size.width() > max_width:
+		reader.setScaledSize(QtCore.QSize(max_width, max(1, round(size.height() * max_width / size.width()))))
+	return reader.read()
+
 
 class ApprovalDialog(QtWidgets.QDialog):
 	"""Modal dialog prompting the user to approve, retry, skip, or cancel agent actions."""
 
+	_RETRY_TEXT = '🔄 再考'
+
 	def __init__(self, payload: dict[str, Any], parent: QtWidgets.QWidget | None = None) -> None:
 		super().__init__(parent)
 		self.setWindowTitle('ステップ承認が必要です')
@@ -80,7 +162,7 @@ class ApprovalDialog(QtWidgets.QDialog):
 		button_row.addWidget(self._skip_button)
 
 		# Retry button (orange, caution)
-		self._retry_button = QtWidgets.QPushButton('🔄 再考')
+		self._retry_button = QtWidgets.QPushButton(self._RETRY_TEXT)
 		self._retry_button.setStyleSheet(
 			'background-color: #ff9800; color: white; font-weight: bold; '
 			'padding: 12px 24px; font-size: 14px; border-radius: 4px;'
@@ -107,6 +189,21 @@ class ApprovalDialog(QtWidgets.QDialog):
 
 		self._populate()
 
+	def reset(self, payload: dict[str, Any]) -> None:
+		"""Reuse this dialog for a new approval request instead of building a new one."""
+		self._payload = payload
+		self._decision = 'cancel'
+		self._feedback = None
+
+		self._actions_list.clear()
+		self._feedback_edit.clear()
+		self._feedback_section.setVisible(False)
+		self._retry_button.setText(self._RETRY_TEXT)
+		self._thinking_toggle.setChecked(False)
+		self._thinking_label.setVisible(False)
+
+		self._populate()
+
 	@property
 	def decision(self) -> ApprovalDecision:
 		return self._decision
@@ -166,42 +263,11 @@ class ApprovalDialog(QtWidgets.QDialog):
 			self._image_label.setPixmap(QtGui.QPixmap())
 			return
 
-		data = encoded
-		if data.startswith('data:image'):
-			data = data.split(',', 1)[-1]
-
-		try:
-			image_bytes = base64.b64decode(data, validate=False)
-		except (ValueError, TypeError):
+		pixmap = _load_screenshot_pixmap(encoded)
+		if pixmap is None:
 			self._show_screenshot_error()
 			return
 
-		pixmap = QtGui.QPixmap()
-		if not pixmap.loadFromData(image_bytes):
-			# Some environments bundle Qt without JPEG support. Try converting via Pillow.
-			try:
-				from io import BytesIO
-
-				from PIL import Image  # type: ignore
-			except Exception:
-				self._show_screenshot_error()
-				return
-
-			try:
-				with Image.open(BytesIO(image_bytes)) as img:
-					buffer = BytesIO()
-					img.save(buffer, format='PNG')
-					png_bytes = buffer.getvalue()
-				if not pixmap.loadFromData(png_bytes, 'PNG'):
-					self._show_screenshot_error()
-					return
-			except Exception:
-				self._show_screenshot_error()
-				return
-
-		max_width = 640
-		if pixmap.width() > max_width:
-			pixmap = pixmap.scaledToWidth(max_width, QtCore.Qt.TransformationMode.SmoothTransformation)
 		self._image_label.setPixmap(pixmap)
 		self._image_label.setText('')
 
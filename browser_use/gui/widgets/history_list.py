@@ -1,17 +1,19 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from typing import Iterable
 
-from PySide6 import QtCore, QtWidgets
+from PySide6 import QtWidgets
 
 
 @dataclass(slots=True)
 class TaskHistoryEntry:
 	task: str
 	status: str = '準備中'
-	started_at: QtCore.QDateTime = field(default_factory=QtCore.QDateTime.currentDateTime)
-	finished_at: QtCore.QDateTime | None = None
+	# time.time() の値（表示時にだけ書式化する）
+	started_at: float = field(default_factory=time.time)
+	finished_at: float | None = None
 	result_summary: str | None = None
 
 
@@ -27,14 +29,16 @@ class TaskHistoryList(QtWidgets.QGroupBox):
 		layout = QtWidgets.QVBoxLayout(self)
 		layout.addWidget(self.list_widget)
 
+	@staticmethod
+	def _format_entry(entry: TaskHistoryEntry) -> str:
+		start_time = time.strftime('%H:%M:%S', time.localtime(entry.started_at))
+		task_text = entry.task
+		if len(task_text) > 50:
+			task_text = task_text[:47] + '...'
+		return f'[{entry.status}] {start_time}  {task_text}'
+
 	def set_entries(self, entries: Iterable[TaskHistoryEntry], select_index: int | None = None) -> None:
-		items: list[str] = []
-		for entry in entries:
-			start_time = entry.started_at.toString('HH:mm:ss')
-			task_text = entry.task
-			if len(task_text) > 50:
-				task_text = task_text[:47] + '...'
-			items.append(f'[{entry.status}] {start_time}  {task_text}')
+		items = [self._format_entry(entry) for entry in entries]
 
 		self.list_widget.blockSignals(True)
 		self.list_widget.clear()
@@ -45,6 +49,21 @@ class TaskHistoryList(QtWidgets.QGroupBox):
 		if select_index is not None and 0 <= select_index < self.list_widget.count():
 			self.list_widget.setCurrentRow(select_index)
 
+	def insert_entry(self, row: int, entry: TaskHistoryEntry, *, select: bool = True) -> None:
+		"""Insert a single row without rebuilding the list."""
+		self.list_widget.blockSignals(True)
+		self.list_widget.insertItem(row, self._format_entry(entry))
+		self.list_widget.blockSignals(False)
+
+		if select:
+			self.list_widget.setCurrentRow(row)
+
+	def update_entry(self, row: int, entry: TaskHistoryEntry) -> None:
+		"""Refresh the text of one row after its entry changed."""
+		item = self.list_widget.item(row)
+		if item is not None:
+			item.setText(self._format_entry(entry))
+
 	def current_row(self) -> int:
 		return self.list_widget.currentRow()
 
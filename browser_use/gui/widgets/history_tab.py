@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import time
+
 from PySide6 import QtCore, QtWidgets
 
 from .history_list import TaskHistoryEntry, TaskHistoryList
@@ -52,12 +54,12 @@ class TaskDetailPanel(QtWidgets.QWidget):
 		self.status_label.setText(f'{icon} {entry.status}')
 
 		self.result_label.setText(entry.result_summary or '—')
-		self.started_label.setText(entry.started_at.toString('yyyy-MM-dd HH:mm:ss'))
+		self.started_label.setText(time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry.started_at)))
 
-		if entry.finished_at:
-			self.finished_label.setText(entry.finished_at.toString('yyyy-MM-dd HH:mm:ss'))
+		if entry.finished_at is not None:
+			self.finished_label.setText(time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry.finished_at)))
 			# 実行時間を計算
-			duration_secs = entry.started_at.secsTo(entry.finished_at)
+			duration_secs = int(entry.finished_at - entry.started_at)
 			if duration_secs >= 60:
 				minutes = duration_secs // 60
 				seconds = duration_secs % 60
@@ -58,7 +58,11 @@ class ModelInfoPanel(QtWidgets.QGroupBox):
 	def update_summary(self, summary: dict[str, Any]) -> None:
 		self.model_label.setText(str(summary.get('model', '—')))
 		self.temperature_label.setText(str(summary.get('temperature', '—')))
-		self.thinking_label.setText('有効' if summary.get('use_thinking') else '無効')
+		use_thinking = summary.get('use_thinking')
+		if use_thinking is None:
+			self.thinking_label.setText('—')
+		else:
+			self.thinking_label.setText('有効' if use_thinking else '無効')
 
 	def reset(self) -> None:
 		self.model_label.setText('—')
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from PySide6 import QtGui, QtWidgets
+import re
+
+from PySide6 import QtWidgets
+
+# 大文字化したコピーを作らずに、大文字小文字を区別せずタグを探す（タグなしの行は 1 回の走査で済む）
+_LOG_TAG = re.compile(r'\[(event|cdp)\]', re.IGNORECASE)
+_EVENT_TAG = re.compile(r'\[event\]', re.IGNORECASE)
 
 
 class LogTabsPanel(QtWidgets.QGroupBox):
 	"""Tabbed view for log messages."""
 
+	MAX_LOG_LINES = 5000
+
 	def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
 		super().__init__('ログ', parent)
 
@@ -21,24 +29,42 @@ class LogTabsPanel(QtWidgets.QGroupBox):
 		layout = QtWidgets.QVBoxLayout(self)
 		layout.addWidget(self.tabs)
 
-	def _create_editor(self) -> QtWidgets.QTextEdit:
-		editor = QtWidgets.QTextEdit()
+	def _create_editor(self) -> QtWidgets.QPlainTextEdit:
+		editor = QtWidgets.QPlainTextEdit()
 		editor.setReadOnly(True)
-		editor.setLineWrapMode(QtWidgets.QTextEdit.LineWrapMode.NoWrap)
+		editor.setUndoRedoEnabled(False)
+		editor.setLineWrapMode(QtWidgets.QPlainTextEdit.LineWrapMode.NoWrap)
+		# 古い行を捨ててメモリ使用量を抑える
+		editor.setMaximumBlockCount(self.MAX_LOG_LINES)
 		return editor
 
+	def _target_for(self, message: str) -> QtWidgets.QPlainTextEdit:
+		match = _LOG_TAG.search(message)
+		if match is None:
+			return self.main_log
+		# [EVENT] が優先されるので、先に [CDP] が見つかった場合は残りに [EVENT] がないか確認する
+		if len(match.group(1)) == 5 or _EVENT_TAG.search(message, match.end()):
+			return self.event_log
+		return self.cdp_log
+
 	def append_message(self, message: str) -> None:
-		target = self.main_log
-		log_upper = message.upper()
-		if '[EVENT]' in log_upper:
-			target = self.event_log
-		elif '[CDP]' in log_upper:
-			target = self.cdp_log
-
-		target.append(message)
-		cursor = target.textCursor()
-		cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
-		target.setTextCursor(cursor)
+		self._append_batch([message])
+
+	def append_messages(self, messages: list[str]) -> None:
+		"""Append a batch of messages with one append per editor.
+
+		appendPlainText keeps following the end only while the view is scrolled to the bottom,
+		so a user reading older lines is not yanked back down.
+		"""
+		self._append_batch(messages)
+
+	def _append_batch(self, messages: list[str]) -> None:
+		batches: dict[QtWidgets.QPlainTextEdit, list[str]] = {}
+		for message in messages:
+			batches.setdefault(self._target_for(message), []).append(message)
+
+		for target, lines in batches.items():
+			target.appendPlainText('\n'.join(lines))
 
 	def clear_all(self) -> None:
 		for editor in (self.main_log, self.event_log, self.cdp_log):
@@ -37,7 +37,9 @@ class StepInfoPanel(QtWidgets.QWidget):
 
 		# 2. 重要: 実行中のアクション
 		actions_group = QtWidgets.QGroupBox()
-		actions_group.setStyleSheet('QGroupBox { border: 1px solid #ccc; border-radius: 4px; margin-top: 10px; padding-top: 10px; }')
+		actions_group.setStyleSheet(
+			'QGroupBox { border: 1px solid #ccc; border-radius: 4px; margin-top: 10px; padding-top: 10px; }'
+		)
 		actions_layout = QtWidgets.QVBoxLayout(actions_group)
 
 		# タイトルラベルを別途追加
@@ -88,6 +90,10 @@ class StepInfoPanel(QtWidgets.QWidget):
 
 		layout.addStretch()
 
+		# 最後に描画した表示値（フィールド単位で差分を取り、変わったウィジェットだけ更新する）
+		self._rendered: dict[str, Any] = {}
+		self.clear()
+
 	def _create_text_edit(self, *, max_height: int = 80, min_height: int = 50) -> QtWidgets.QPlainTextEdit:
 		edit = QtWidgets.QPlainTextEdit()
 		edit.setReadOnly(True)
@@ -101,25 +107,74 @@ class StepInfoPanel(QtWidgets.QWidget):
 
 	def clear(self) -> None:
 		self._snapshot = None
-		self.next_goal_label.setText('タスク実行待機中...')
-		self.actions_list.clear()
-		self.step_label.setText('—')
-		self.url_label.setText('—')
-		self.title_label.setText('—')
-		self.thinking_edit.clear()
-		self.memory_edit.clear()
-		self.evaluation_edit.clear()
+		self._render(self._display_values(None))
 
 	def update_snapshot(self, snapshot: dict[str, Any]) -> None:
 		self._snapshot = snapshot
-
-		# 1. Next Goal を最優先で更新
-		next_goal = snapshot.get('next_goal') or 'ゴール設定中...'
-		self.next_goal_label.setText(next_goal)
-
-		# 2. Actions をリスト形式で表示
+		self._render(self._display_values(snapshot))
+
+	@staticmethod
+	def _display_values(snapshot: dict[str, Any] | None) -> dict[str, Any]:
+		"""Map a step snapshot (None = idle) to the value shown by each widget."""
+		if snapshot is None:
+			return {
+				'next_goal': 'タスク実行待機中...',
+				'actions': None,
+				'step': '—',
+				'url': '—',
+				'title': '—',
+				'thinking': '',
+				'memory': '',
+				'evaluation': '',
+			}
+
+		# ステップ番号（プログレスバーウィジェットなし、文字表示のみ）
+		step_number = snapshot.get('step_number')
+		max_steps = snapshot.get('max_steps')
+		if step_number is not None and max_steps:
+			step_text = f'{step_number}/{max_steps}'
+		elif step_number is not None:
+			step_text = f'{step_number}'
+		else:
+			step_text = '—'
+
+		return {
+			'next_goal': snapshot.get('next_goal') or 'ゴール設定中...',
+			'actions': tuple(snapshot.get('actions') or ()),
+			'step': step_text,
+			'url': snapshot.get('url') or '—',
+			'title': snapshot.get('title') or '—',
+			'thinking': snapshot.get('thinking') or '',
+			'memory': snapshot.get('memory') or '',
+			'evaluation': snapshot.get('evaluation_previous_goal') or '',
+		}
+
+	def _render(self, values: dict[str, Any]) -> None:
+		# 前回と同じ値のウィジェットは再設定しない（ドキュメントの作り直しと再描画を避ける）
+		changed = {key: value for key, value in values.items() if key not in self._rendered or self._rendered[key] != value}
+		self._rendered = values
+
+		if 'next_goal' in changed:
+			self.next_goal_label.setText(changed['next_goal'])
+		if 'actions' in changed:
+			self._render_actions(changed['actions'])
+		if 'step' in changed:
+			self.step_label.setText(changed['step'])
+		if 'url' in changed:
+			self.url_label.setText(changed['url'])
+		if 'title' in changed:
+			self.title_label.setText(changed['title'])
+		if 'thinking' in changed:
+			self.thinking_edit.setPlainText(changed['thinking'])
+		if 'memory' in changed:
+			self.memory_edit.setPlainText(changed['memory'])
+		if 'evaluation' in changed:
+			self.evaluation_edit.setPlainText(changed['evaluation'])
+
+	def _render_actions(self, actions: tuple[str, ...] | None) -> None:
 		self.actions_list.clear()
-		actions = snapshot.get('actions') or []
+		if actions is None:
+			return
 		if actions:
 			for action in actions:
 				item = QtWidgets.QListWidgetItem(f'• {action}')
@@ -129,28 +184,6 @@ class StepInfoPanel(QtWidgets.QWidget):
 			item.setForeground(QtGui.QColor('#999'))
 			self.actions_list.addItem(item)
 
-		# 3. ステップ番号（プログレスバーウィジェットなし、文字表示のみ）
-		step_number = snapshot.get('step_number')
-		max_steps = snapshot.get('max_steps')
-		if step_number is not None and max_steps:
-			self.step_label.setText(f'{step_number}/{max_steps}')
-		elif step_number is not None:
-			self.step_label.setText(f'{step_number}')
-		else:
-			self.step_label.setText('—')
-
-		# 4. URL/Title
-		url = snapshot.get('url') or ''
-		self.url_label.setText(url if url else '—')
-
-		title = snapshot.get('title') or ''
-		self.title_label.setText(title if title else '—')
-
-		# 5. 詳細情報
-		self.thinking_edit.setPlainText(snapshot.get('thinking') or '')
-		self.memory_edit.setPlainText(snapshot.get('memory') or '')
-		self.evaluation_edit.setPlainText(snapshot.get('evaluation_previous_goal') or '')
-
 	@property
 	def snapshot(self) -> dict[str, Any] | None:
 		return self._snapshot
@@ -1,51 +1,176 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import functools
+import importlib
 import logging
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
+from pydantic import BaseModel, RootModel
 from PySide6 import QtCore
 
-from browser_use import Agent
-from browser_use.agent.config import AgentConfig
-from browser_use.agent.views import AgentOutput, AgentStepInfo, ApprovalResult
-from browser_use.browser import BrowserProfile
-from browser_use.browser.views import BrowserStateSummary
 from browser_use.config import CONFIG
-from browser_use.llm.anthropic.chat import ChatAnthropic
-from browser_use.llm.base import BaseChatModel
-from browser_use.llm.google.chat import ChatGoogle
-from browser_use.llm.openai.chat import ChatOpenAI
+
+# エージェント・ブラウザ・LLM SDK は重いので、実際に使う時点で読み込む（GUI の起動を速くするため）
+if TYPE_CHECKING:
+	from browser_use import Agent
+	from browser_use.agent.config import AgentConfig
+	from browser_use.agent.views import AgentOutput, AgentStepInfo, ApprovalResult
+	from browser_use.browser import BrowserProfile
+	from browser_use.browser.views import BrowserStateSummary
+	from browser_use.llm.base import BaseChatModel
 
 
 APPROVAL_TIMEOUT_SECONDS = 300.0  # 5 minutes
+PROGRESS_MIN_INTERVAL_NS = 16_000_000  # ~60 Hz
+
+# (モデル名に含まれる文字列, API キーの CONFIG 属性, モジュール, クラス名, 表示名)。先頭から順に照合し、最後の OpenAI は既定値
+_PROVIDER_MATCHERS: tuple[tuple[str, str, str, str, str], ...] = (
+	('gemini', 'GOOGLE_API_KEY', 'browser_use.llm.google.chat', 'ChatGoogle', 'Google Gemini'),
+	('claude', 'ANTHROPIC_API_KEY', 'browser_use.llm.anthropic.chat', 'ChatAnthropic', 'Anthropic Claude'),
+	('', 'OPENAI_API_KEY', 'browser_use.llm.openai.chat', 'ChatOpenAI', 'OpenAI'),
+)
+
+_PLACEHOLDER_API_KEYS = frozenset(
+	{
+		'your-openai-api-key-here',
+		'your-anthropic-api-key-here',
+		'your-google-api-key-here',
+	}
+)
+
+
+def _config_file_signature() -> tuple[str, int, int] | None:
+	"""Identify the current config file contents by path, mtime and size."""
+	source = CONFIG.source
+	if source is None:
+		return None
+	try:
+		stat = source.stat()
+	except OSError:
+		return None
+	return str(source), stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> str:
+	"""Create a GUI-owned directory once per process; later calls are a dict lookup."""
+	Path(path).mkdir(parents=True, exist_ok=True)
+	return path
+
+
+@functools.lru_cache(maxsize=1)
+def _browser_profile_fields() -> frozenset[str]:
+	"""BrowserProfile field names, computed on first use so the browser package stays lazily imported."""
+	from browser_use.browser import BrowserProfile
+
+	return frozenset(BrowserProfile.model_fields)
+
+
+def summarize_config(raw_config: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+	"""Build the model and browser panel summaries from the raw config dict alone.
+
+	Used before the first run, so no LLM client or BrowserProfile has to be constructed.
+	"""
+	llm_cfg = raw_config.get('llm', {})
+	profile_cfg = raw_config.get('browser_profile', {})
+	llm_summary = {
+		'model': llm_cfg.get('model') or '不明',
+		'temperature': llm_cfg.get('temperature', '—'),
+	}
+	browser_summary = {
+		'headless': bool(profile_cfg.get('headless', False)),
+		# GUI では keep_alive を常に無効化して実行する
+		'keep_alive': False,
+		'proxy': profile_cfg.get('proxy'),
+	}
+	return llm_summary, browser_summary
+
+
+class QtLogFormatter(logging.Formatter):
+	"""Formatter that renders the asctime prefix once per second instead of once per record."""
+
+	def __init__(self, fmt: str | None = None, datefmt: str | None = None) -> None:
+		super().__init__(fmt, datefmt)
+		self._cached_second: int | None = None
+		self._cached_time = ''
+
+	def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:  # noqa: N802
+		if datefmt is not None:
+			return super().formatTime(record, datefmt)
+
+		second = int(record.created)
+		if second != self._cached_second:
+			self._cached_second = second
+			self._cached_time = time.strftime(self.default_time_format, self.converter(record.created))
+		if self.default_msec_format:
+			return self.default_msec_format % (self._cached_time, record.msecs)
+		return self._cached_time
 
 
-class LogEmitter(QtCore.QObject):
-	message = QtCore.Signal(str)
+class QtLogHandler(logging.Handler):
+	"""Buffer logging records for the GUI thread to drain in batches.
 
+	Emitting a Qt signal per record floods the event loop under verbose logging, so records are
+	queued here and the main window drains them on a short timer. Formatting is deferred to
+	drain(), so only the logging call's arguments are resolved on the emitting thread.
+	"""
 
-class QtLogHandler(logging.Handler):
-	"""Forward logging records to the GUI via Qt signals."""
+	MAX_BUFFERED_RECORDS = 10000
+	# 依存ライブラリの INFO/DEBUG は量が多いだけなので GUI には流さない（WARNING 以上は表示する）
+	DEFAULT_QUIET_LOGGERS = frozenset({'httpx', 'httpcore', 'urllib3', 'asyncio', 'PIL'})
 
 	def __init__(self) -> None:
 		super().__init__()
-		self._emitter = LogEmitter()
+		self._buffer: deque[logging.LogRecord] = deque(maxlen=self.MAX_BUFFERED_RECORDS)
+		self._buffer_lock = threading.Lock()
+		self._quiet_loggers = self.DEFAULT_QUIET_LOGGERS
+		self.addFilter(self._filter_quiet_loggers)
 
-	@property
-	def signal(self):
-		return self._emitter.message
+	def set_quiet_loggers(self, names: Iterable[str]) -> None:
+		"""Replace the top-level logger names whose records below WARNING are dropped."""
+		self._quiet_loggers = frozenset(names)
+
+	def _filter_quiet_loggers(self, record: logging.LogRecord) -> bool:
+		# Runs in handle() before emit(), so dropped records are never copied or formatted
+		return record.levelno >= logging.WARNING or record.name.partition('.')[0] not in self._quiet_loggers
 
 	def emit(self, record: logging.LogRecord) -> None:
 		try:
-			msg = self.format(record)
+			# Resolve %-style arguments now; they may be mutated before the GUI thread formats the record
+			record = copy.copy(record)
+			record.msg = record.getMessage()
+			record.args = None
 		except Exception:
 			self.handleError(record)
 			return
 
-		self._emitter.message.emit(msg)
+		with self._buffer_lock:
+			self._buffer.append(record)
+
+	def drain(self) -> list[str]:
+		"""Format and return the buffered records (oldest first), clearing the buffer."""
+		# Idle ticks return without taking the lock; a record appended meanwhile is picked up next tick
+		if not self._buffer:
+			return []
+
+		# Swap in a fresh deque so the lock is held for O(1), however many records piled up
+		with self._buffer_lock:
+			records, self._buffer = self._buffer, deque(maxlen=self.MAX_BUFFERED_RECORDS)
+
+		messages: list[str] = []
+		for record in records:
+			try:
+				messages.append(self.format(record))
+			except Exception:
+				self.handleError(record)
+		return messages
 
 
 @dataclass(slots=True)
@@ -60,77 +185,179 @@ class AgentWorker(QtCore.QThread):
 	finished = QtCore.Signal(bool, str)
 	step_update = QtCore.Signal(dict)
 	approval_requested = QtCore.Signal(dict)
+	config_reloaded = QtCore.Signal(dict, dict)
 
-	def __init__(self, preferences: UserPreferences, parent: QtCore.QObject | None = None) -> None:
+	def __init__(self, preferences: UserPreferences | None = None, parent: QtCore.QObject | None = None) -> None:
 		super().__init__(parent)
-		self._preferences = preferences
+		self._preferences = preferences or UserPreferences(task='')
 		self._cancel_requested = False
 		self._loop: asyncio.AbstractEventLoop | None = None
+		self._loop_ready = threading.Event()
+		self._loop_thread_id: int | None = None
+		self._task_running = False
 		self._agent: Agent[Any, Any] | None = None
+		# 設定ファイルが更新されても LLM/ブラウザ設定が同じなら、クライアント（HTTP 接続プール）とプロファイルを使い回す
+		self._llm_cache: dict[tuple[str, str], BaseChatModel] = {}
+		self._profile_cache: dict[tuple[tuple[str, str], ...], BrowserProfile] = {}
+		self._config_signature = _config_file_signature()
 		self._raw_config: dict[str, Any] = CONFIG.load_config()
 		self._agent_config: AgentConfig = self._build_agent_config()
 		self._pending_approval_future: asyncio.Future[ApprovalResult] | None = None
 
 	def run(self) -> None:  # noqa: D401
-		"""Qt thread entrypoint."""
+		"""Qt thread entrypoint: keep one event loop alive for every task of the app's lifetime."""
+		loop = asyncio.new_event_loop()
+		asyncio.set_event_loop(loop)
+		self._loop = loop
+		self._loop_thread_id = threading.get_ident()
+		self._loop_ready.set()
+
+		try:
+			loop.run_forever()
+		finally:
+			# 残ったタスクの後始末と非同期ジェネレータの終了を 1 回のループ実行でまとめて行う
+			try:
+				loop.run_until_complete(self._shutdown_loop())
+			except Exception as exc:
+				logging.getLogger(__name__).debug(f'イベントループの終了処理でエラー: {exc}')
+			asyncio.set_event_loop(None)
+			loop.close()
+			self._loop = None
+			self._loop_thread_id = None
+			self._loop_ready.clear()
+
+	@staticmethod
+	async def _shutdown_loop() -> None:
+		"""Cancel tasks still pending on the worker loop, then close its async generators."""
+		loop = asyncio.get_running_loop()
+		pending = [task for task in asyncio.all_tasks(loop) if task is not asyncio.current_task()]
+		for task in pending:
+			task.cancel()
+		if pending:
+			await asyncio.gather(*pending, return_exceptions=True)
+		await loop.shutdown_asyncgens()
+
+	@property
+	def is_busy(self) -> bool:
+		"""True while a task is executing on the worker loop."""
+		return self._task_running
+
+	def start_task(self, preferences: UserPreferences) -> None:
+		"""Schedule a task on the persistent worker loop, starting the thread on first use."""
+		if self._task_running:
+			raise RuntimeError('タスクはすでに実行中です。')
+
+		if not self.isRunning():
+			self.start()
+		self._loop_ready.wait()
+		assert self._loop is not None
+
+		self._preferences = preferences
+		self._cancel_requested = False
+		self._task_running = True
+		asyncio.run_coroutine_threadsafe(self._run_task(), self._loop)
+
+	def shutdown(self) -> None:
+		"""Stop the worker loop and wait for the thread to exit (call when the app closes)."""
+		loop = self._loop
+		if loop is not None:
+			loop.call_soon_threadsafe(loop.stop)
+		self.wait()
+
+	async def _run_task(self) -> None:
 		logger = logging.getLogger(__name__)
 		self.status.emit('初期化中…')
-		self._loop = asyncio.new_event_loop()
-		asyncio.set_event_loop(self._loop)
 
 		try:
-			self._loop.run_until_complete(self._execute())
+			await self._execute()
 		except asyncio.CancelledError:
-			self.finished.emit(False, 'ユーザーによりキャンセルされました')
+			success, message = False, 'ユーザーによりキャンセルされました'
 		except Exception as exc:  # pragma: no cover - GUI side-effects
 			logger.exception('GUI worker failed', exc_info=exc)
-			self.finished.emit(False, str(exc))
+			success, message = False, str(exc)
 		else:
-			self.finished.emit(True, 'タスクが完了しました')
-		finally:
-			try:
-				self._loop.run_until_complete(self._cleanup())
-			except Exception as cleanup_exc:  # pragma: no cover - cleanup best-effort
-				logger.warning(f'Cleanup error: {cleanup_exc}')
+			success, message = True, 'タスクが完了しました'
 
-			try:
-				self._loop.run_until_complete(self._loop.shutdown_asyncgens())
-			except Exception:
-				pass
-			asyncio.set_event_loop(None)
-			self._loop.close()
-			self._loop = None
-			self._agent = None
+		# ループは次のタスクでも使うので、完了通知の前にエージェントを片付けておく
+		try:
+			await self._cleanup()
+		except Exception as cleanup_exc:  # pragma: no cover - cleanup best-effort
+			logger.warning(f'Cleanup error: {cleanup_exc}')
+		self._agent = None
+
+		self._task_running = False
+		self.finished.emit(success, message)
 
 	def request_cancel(self) -> None:
 		self._cancel_requested = True
 
+		from browser_use.agent.views import ApprovalResult
+
 		agent = self._agent
-		loop = self._loop
+		resolve_approval = self._approval_resolver(ApprovalResult(decision='cancel'))
+
+		# 停止と承認待ちの解除を 1 回のコールバックにまとめてループへ渡す
+		def _cancel() -> None:
+			if agent is not None:
+				agent.stop()
+			if resolve_approval is not None:
+				resolve_approval()
+
+		self._call_soon_in_loop(_cancel)
 
-		if agent is not None and loop is not None:
-			loop.call_soon_threadsafe(agent.stop)
-		self._finish_pending_approval(ApprovalResult(decision='cancel'))
+	def _call_soon_in_loop(self, callback: Callable[[], None]) -> None:
+		"""Schedule a callback on the worker loop, skipping the thread-safe wakeup when already on it."""
+		loop = self._loop
+		if loop is None:
+			return
+		if threading.get_ident() == self._loop_thread_id:
+			loop.call_soon(callback)
+		else:
+			loop.call_soon_threadsafe(callback)
 
 	async def _execute(self) -> None:
 		task = self._preferences.task.strip()
 		if not task:
 			raise ValueError('タスク内容が空です。')
 
-		current_config = CONFIG.load_config()
-		if current_config != self._raw_config:
-			self._raw_config = current_config
-			self._agent_config = self._build_agent_config()
+		# 設定ファイルが更新された時だけ読み直し、エージェント設定（LLM含む）を作り直す
+		signature = _config_file_signature()
+		if signature != self._config_signature:
+			previous_raw_config = self._raw_config
+			self._raw_config = CONFIG.load_config(reload=True)
+			try:
+				agent_config = self._build_agent_config()
+			except Exception:
+				# 作り直しに失敗したら署名は更新せず、次回の実行でもう一度読み直す
+				self._raw_config = previous_raw_config
+				raise
+			self._agent_config = agent_config
+			self._config_signature = signature
+			# 実行開始時のパネル表示は前回の設定のままなので、読み直した内容を GUI に通知する
+			self.config_reloaded.emit(self.llm_summary, self.browser_summary)
 
 		self._agent_config.task = task
 
+		from browser_use import Agent
+
 		agent = Agent(config=self._agent_config)
 		self._agent = agent
 
+		# 実行中に変わらない値はステップごとに引かず、ここで一度だけ取得する
+		total = getattr(agent.settings, 'max_steps', self._preferences.max_steps)
+		last_progress_ns = 0
+		last_progress_step = -1
+
 		async def on_step_end(agent_ref: Agent[Any, Any]) -> None:
+			nonlocal last_progress_ns, last_progress_step
 			current = agent_ref.state.n_steps
-			total = getattr(agent_ref.settings, 'max_steps', self._preferences.max_steps)
-			self.progress.emit(current, total)
+			# 速いステップが続いても GUI スレッドを起こすのは 1 フレームに 1 回まで（最終ステップは必ず通知）
+			if current != last_progress_step:
+				now_ns = time.monotonic_ns()
+				if current == total or now_ns - last_progress_ns >= PROGRESS_MIN_INTERVAL_NS:
+					last_progress_ns = now_ns
+					last_progress_step = current
+					self.progress.emit(current, total)
 
 			if self._cancel_requested:
 				agent_ref.stop()
@@ -168,52 +395,54 @@ class AgentWorker(QtCore.QThread):
 			raise RuntimeError('LLMモデルが設定されていません。設定ファイルか環境変数を確認してください。')
 
 		api_key = llm_cfg.get('api_key')
-		placeholder_keys = {
-			'your-openai-api-key-here',
-			'your-anthropic-api-key-here',
-			'your-google-api-key-here',
-		}
 		model_lower = model_name.lower()
 
-		def _ensure_key(value: str | None, provider: str) -> str:
-			match = value or ''
-			if not match or match in placeholder_keys:
-				raise RuntimeError(f'{provider} の API キーが設定されていません。環境変数または config を確認してください。')
-			return match
-
-		if 'gemini' in model_lower:
-			key = api_key or CONFIG.GOOGLE_API_KEY
-			return ChatGoogle(model=model_name, api_key=_ensure_key(key, 'Google Gemini'))
+		_, key_attr, module_name, class_name, provider = next(
+			matcher for matcher in _PROVIDER_MATCHERS if matcher[0] in model_lower
+		)
 
-		if model_lower.startswith('claude') or 'claude' in model_lower:
-			key = api_key or CONFIG.ANTHROPIC_API_KEY
-			return ChatAnthropic(model=model_name, api_key=_ensure_key(key, 'Anthropic Claude'))
+		key = api_key or getattr(CONFIG, key_attr)
+		if not key or key in _PLACEHOLDER_API_KEYS:
+			raise RuntimeError(f'{provider} の API キーが設定されていません。環境変数または config を確認してください。')
 
-		key = api_key or CONFIG.OPENAI_API_KEY
-		return ChatOpenAI(model=model_name, api_key=_ensure_key(key, 'OpenAI'))
+		cache_key = (model_name, key)
+		llm = self._llm_cache.get(cache_key)
+		if llm is None:
+			# プロバイダ SDK は重いので、使うものだけをここで読み込む
+			llm_class = getattr(importlib.import_module(module_name), class_name)
+			llm = llm_class(model=model_name, api_key=key)
+			self._llm_cache[cache_key] = llm
+		return llm
 
 	def _build_browser_profile(self) -> BrowserProfile:
+		from browser_use.browser import BrowserProfile
+
 		profile_cfg = self._raw_config.get('browser_profile', {})
-		gui_profile_dir = CONFIG.BROWSER_USE_PROFILES_DIR / 'gui'
-		gui_profile_dir.mkdir(parents=True, exist_ok=True)
+		gui_profile_dir = _ensure_dir(str(CONFIG.BROWSER_USE_PROFILES_DIR / 'gui'))
 
-		allowed_keys = set(BrowserProfile.model_fields.keys())
+		allowed_keys = _browser_profile_fields()
 		filtered: dict[str, Any] = {key: value for key, value in profile_cfg.items() if key in allowed_keys and value is not None}
 
 		# GUI用のプロファイルディレクトリをデフォルトにする
-		filtered.setdefault('user_data_dir', str(gui_profile_dir))
+		filtered.setdefault('user_data_dir', gui_profile_dir)
 		filtered.setdefault('headless', False)
 		# GUIではタスク完了時にブラウザを自動で閉じたいので keep_alive を強制的に無効化する
 		filtered['keep_alive'] = False
 
 		if 'downloads_path' not in filtered:
-			downloads_dir = Path(CONFIG.BROWSER_USE_DOWNLOADS_DIR) / 'gui'
-			downloads_dir.mkdir(parents=True, exist_ok=True)
-			filtered['downloads_path'] = str(downloads_dir)
+			filtered['downloads_path'] = _ensure_dir(str(Path(CONFIG.BROWSER_USE_DOWNLOADS_DIR) / 'gui'))
 
-		return BrowserProfile(**filtered)
+		# BrowserSession は受け取ったプロファイルを複製して使うので、同じ設定なら使い回しても安全
+		cache_key = tuple(sorted((key, repr(value)) for key, value in filtered.items()))
+		profile = self._profile_cache.get(cache_key)
+		if profile is None:
+			profile = BrowserProfile(**filtered)
+			self._profile_cache[cache_key] = profile
+		return profile
 
 	def _build_agent_config(self) -> AgentConfig:
+		from browser_use.agent.config import AgentConfig
+
 		llm = self._resolve_llm()
 		browser_profile = self._build_browser_profile()
 		interactive_mode = self._interactive_mode_enabled()
@@ -296,14 +525,22 @@ class AgentWorker(QtCore.QThread):
 
 		summaries: list[str] = []
 		for action in model_output.action:
-			data = action.model_dump(exclude_unset=True)
-			if not data:
+			# model_dump() would serialize the whole action just to read one key; use the set fields instead
+			if isinstance(action, RootModel):
+				# Union action models wrap the concrete action model
+				action = action.root
+			fields_set = action.model_fields_set
+			if not fields_set:
 				continue
-			action_name, params = next(iter(data.items()))
+			action_name = next(name for name in type(action).model_fields if name in fields_set)
+			params = getattr(action, action_name)
 
 			# Get Japanese label or use original name
 			label = action_labels.get(action_name, action_name)
 
+			if isinstance(params, BaseModel):
+				params_set = params.model_fields_set
+				params = {key: getattr(params, key) for key in ('text', 'url', 'tab_id') if key in params_set}
 			if not params:
 				summaries.append(label)
 				continue
@@ -343,6 +580,8 @@ class AgentWorker(QtCore.QThread):
 		model_output: AgentOutput,
 		browser_state_summary: BrowserStateSummary,
 	) -> ApprovalResult:
+		from browser_use.agent.views import ApprovalResult
+
 		logger = logging.getLogger(__name__)
 
 		if self._loop is None:
@@ -370,17 +609,21 @@ class AgentWorker(QtCore.QThread):
 			self._pending_approval_future = None
 
 	def _finish_pending_approval(self, result: ApprovalResult) -> None:
-		loop = self._loop
-		future = self._pending_approval_future
+		resolve = self._approval_resolver(result)
+		if resolve is not None:
+			self._call_soon_in_loop(resolve)
 
-		if loop is None or future is None:
-			return
+	def _approval_resolver(self, result: ApprovalResult) -> Callable[[], None] | None:
+		"""Return a loop-side callback resolving the approval pending right now, if any."""
+		future = self._pending_approval_future
+		if future is None:
+			return None
 
 		def _resolve() -> None:
 			if not future.done():
 				future.set_result(result)
 
-		loop.call_soon_threadsafe(_resolve)
+		return _resolve
 
 	def _build_approval_payload(
 		self,
@@ -1,5 +1,8 @@
+import atexit
 import logging
 import os
+import queue
+import threading
 
 from posthog import Posthog
 from uuid_extensions import uuid7str
@@ -55,12 +58,48 @@ class ProductTelemetry:
 		if self._posthog_client is None:
 			logger.debug('Telemetry disabled')
 
+		self._capture_queue: queue.Queue[BaseTelemetryEvent] = queue.Queue()
+		self._capture_worker: threading.Thread | None = None
+		self._capture_worker_lock = threading.Lock()
+
 	def capture(self, event: BaseTelemetryEvent) -> None:
 		if self._posthog_client is None:
 			return
 
 		self._direct_capture(event)
 
+	def capture_nowait(self, event: BaseTelemetryEvent) -> None:
+		"""
+		Queue an event for the background capture thread so the caller never waits on
+		building event properties. PostHog's own consumer batches the actual uploads.
+		"""
+		if self._posthog_client is None:
+			return
+
+		self._ensure_capture_worker()
+		self._capture_queue.put(event)
+
+	def _ensure_capture_worker(self) -> None:
+		if self._capture_worker is not None:
+			return
+
+		with self._capture_worker_lock:
+			if self._capture_worker is None:
+				self._capture_worker = threading.Thread(
+					target=self._capture_worker_loop, name='browser-use-telemetry', daemon=True
+				)
+				self._capture_worker.start()
+				# Registered after PostHog's own atexit hook, so it runs first and hands over pending events
+				atexit.register(self._capture_queue.join)
+
+	def _capture_worker_loop(self) -> None:
+		while True:
+			event = self._capture_queue.get()
+			try:
+				self._direct_capture(event)
+			finally:
+				self._capture_queue.task_done()
+
 	def _direct_capture(self, event: BaseTelemetryEvent) -> None:
 		"""
 		Should not be thread blocking because posthog magically handles it
@@ -78,6 +117,9 @@ class ProductTelemetry:
 			logger.error(f'Failed to send telemetry event {event.name}: {e}')
 
 	def flush(self) -> None:
+		if self._capture_worker is not None:
+			self._capture_queue.join()
+
 		if self._posthog_client:
 			try:
 				self._posthog_client.flush()
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from typing import Any, Literal
 
 from browser_use.config import is_running_in_docker
@@ -15,7 +15,8 @@ class BaseTelemetryEvent(ABC):
 
 	@property
 	def properties(self) -> dict[str, Any]:
-		props = {k: v for k, v in asdict(self).items() if k != 'name'}
+		# Shallow field read: asdict() would deep-copy payloads such as the full action history
+		props = {field.name: getattr(self, field.name) for field in fields(self) if field.name != 'name'}
 		# Add Docker context if running in Docker
 		props['is_docker'] = is_running_in_docker()
 		return props
@@ -28,6 +28,8 @@ Context = TypeVar('Context')
 
 logger = logging.getLogger(__name__)
 
+PROMPT_DESCRIPTION_CACHE_SIZE = 64
+
 
 class Registry(Generic[Context]):
 	"""Service for registering and managing actions"""
@@ -36,6 +38,8 @@ class Registry(Generic[Context]):
 		self.registry = ActionRegistry()
 		self.telemetry = ProductTelemetry()
 		self.exclude_actions = exclude_actions if exclude_actions is not None else []
+		# page_url -> prompt description, cleared whenever a new action is registered
+		self._prompt_description_cache: dict[str | None, str] = {}
 
 	def _get_special_param_types(self) -> dict[str, type | UnionType | None]:
 		"""Get the expected types for special parameters from SpecialActionParameters"""
@@ -276,6 +280,7 @@ class Registry(Generic[Context]):
 		param_model: type[BaseModel] | None = None,
 		domains: list[str] | None = None,
 		allowed_domains: list[str] | None = None,
+		mutates_dom: bool = True,
 	):
 		"""Decorator for registering actions"""
 		# Handle aliases: domains and allowed_domains are the same parameter
@@ -298,8 +303,10 @@ class Registry(Generic[Context]):
 				function=normalized_func,
 				param_model=actual_param_model,
 				domains=final_domains,
+				mutates_dom=mutates_dom,
 			)
 			self.registry.actions[func.__name__] = action
+			self._prompt_description_cache.clear()
 
 			# Return the normalized function so it can be called with kwargs
 			return normalized_func
@@ -569,4 +576,10 @@ class Registry(Generic[Context]):
 		If page_url is provided, only include actions that are available for that URL
 		based on their domain filters
 		"""
-		return self.registry.get_prompt_description(page_url=page_url)
+		description = self._prompt_description_cache.get(page_url)
+		if description is None:
+			if len(self._prompt_description_cache) >= PROMPT_DESCRIPTION_CACHE_SIZE:
+				self._prompt_description_cache.clear()
+			description = self.registry.get_prompt_description(page_url=page_url)
+			self._prompt_description_cache[page_url] = description
+		return description
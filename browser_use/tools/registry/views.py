@@ -22,6 +22,9 @@ class RegisteredAction(BaseModel):
 	# filters: provide specific domains to determine whether the action should be available on the given URL or not
 	domains: list[str] | None = None  # e.g. ['*.google.com', 'www.bing.com', 'yahoo.*]
 
+	# whether running the action can change the page's DOM; read-only actions let multi_act skip the DOM re-snapshot
+	mutates_dom: bool = True
+
 	model_config = ConfigDict(arbitrary_types_allowed=True)
 
 	def prompt_description(self) -> str:
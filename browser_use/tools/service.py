@@ -556,6 +556,7 @@ class Tools(Generic[Context]):
 
 		@self.registry.action(
 			"""LLM extracts structured data from page markdown. Use when: on right page, know what to extract, haven't called before on same page+query. Can't get interactive elements. Set extract_links=True for URLs. Use start_from_char if truncated. If fails, use find_text/scroll instead.""",
+			mutates_dom=False,
 		)
 		async def extract(
 			query: str,
@@ -821,6 +822,7 @@ You will be given a query and the markdown of a webpage that has been filtered t
 
 		@self.registry.action(
 			'Request screenshot of current viewport. Use when: visual inspection needed, layout unclear, element positions uncertain, debugging UI issues, or verifying page state. Screenshot included in next observation.',
+			mutates_dom=False,
 		)
 		async def screenshot():
 			"""Request that a screenshot be included in the next observation"""
@@ -839,6 +841,7 @@ You will be given a query and the markdown of a webpage that has been filtered t
 		@self.registry.action(
 			'',
 			param_model=GetDropdownOptionsAction,
+			mutates_dom=False,
 		)
 		async def dropdown_options(params: GetDropdownOptionsAction, browser_session: BrowserSession):
 			"""Get all options from a native dropdown or ARIA menu"""
@@ -906,7 +909,7 @@ You will be given a query and the markdown of a webpage that has been filtered t
 					return ActionResult(error=error_msg)
 
 		# File System Actions
-		@self.registry.action('')
+		@self.registry.action('', mutates_dom=False)
 		async def write_file(
 			file_name: str,
 			content: str,
@@ -926,13 +929,13 @@ You will be given a query and the markdown of a webpage that has been filtered t
 			logger.info(f'💾 {result}')
 			return ActionResult(extracted_content=result, long_term_memory=result)
 
-		@self.registry.action('')
+		@self.registry.action('', mutates_dom=False)
 		async def replace_file(file_name: str, old_str: str, new_str: str, file_system: FileSystem):
 			result = await file_system.replace_file_str(file_name, old_str, new_str)
 			logger.info(f'💾 {result}')
 			return ActionResult(extracted_content=result, long_term_memory=result)
 
-		@self.registry.action('')
+		@self.registry.action('', mutates_dom=False)
 		async def read_file(file_name: str, available_file_paths: list[str], file_system: FileSystem):
 			if available_file_paths and file_name in available_file_paths:
 				result = await file_system.read_file(file_name, external_file=True)
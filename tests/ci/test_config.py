@@ -292,3 +292,60 @@ class TestLazyConfig:
 			else:
 				os.environ.pop('BROWSER_USE_CONFIG_PATH', None)
 			CONFIG.reload()
+
+	def test_resolved_paths_are_reused_between_reads(self, tmp_path, monkeypatch):
+		"""Repeated path reads should reuse the resolved paths until the environment changes."""
+		monkeypatch.setenv('BROWSER_USE_CONFIG_DIR', str(tmp_path / 'first'))
+		CONFIG.reload()
+
+		first = CONFIG.BROWSER_USE_PROFILES_DIR
+		assert first.is_dir()
+		assert CONFIG.BROWSER_USE_PROFILES_DIR is first
+
+		monkeypatch.setenv('BROWSER_USE_CONFIG_DIR', str(tmp_path / 'second'))
+		second = CONFIG.BROWSER_USE_PROFILES_DIR
+		assert second == tmp_path / 'second' / 'profiles'
+		assert second.is_dir()
+
+	def test_config_data_is_shared_read_only_snapshot(self):
+		"""CONFIG.data should hand out the same immutable snapshot until the next reload."""
+		CONFIG.reload()
+		snapshot = load_config_yaml()
+		assert load_config_yaml() is snapshot
+		with pytest.raises(TypeError):
+			snapshot['agent']['max_steps'] = 1  # type: ignore[index]
+
+		reloaded = load_config_yaml(reload=True)
+		assert reloaded is not snapshot
+		assert reloaded['agent']['max_steps'] == snapshot['agent']['max_steps']
+
+	def test_unchanged_config_file_is_not_reparsed(self, tmp_path, monkeypatch):
+		"""Reloading an unchanged file should reuse the parsed YAML, edits should be picked up."""
+		import yaml
+
+		config_path = tmp_path / 'cached-config.yaml'
+		config_path.write_text('agent:\n  max_steps: 7\n', encoding='utf-8')
+		monkeypatch.setenv('BROWSER_USE_CONFIG_PATH', str(config_path))
+
+		parse_calls = 0
+		original_load = yaml.load
+
+		def counting_load(stream, Loader):
+			nonlocal parse_calls
+			parse_calls += 1
+			return original_load(stream, Loader=Loader)
+
+		monkeypatch.setattr(yaml, 'load', counting_load)
+		try:
+			assert load_config_yaml(reload=True)['agent']['max_steps'] == 7
+			assert load_config_yaml(reload=True)['agent']['max_steps'] == 7
+			assert parse_calls == 1
+
+			config_path.write_text('agent:\n  max_steps: 9\n', encoding='utf-8')
+			stat = config_path.stat()
+			os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+			assert load_config_yaml(reload=True)['agent']['max_steps'] == 9
+			assert parse_calls == 2
+		finally:
+			monkeypatch.undo()
+			CONFIG.reload()
@@ -838,6 +838,26 @@ class TestParameterOrdering:
 		assert set(model_fields.keys()) == {'first', 'second', 'third'}
 		assert model_fields['third'].default is True
 
+	def test_prompt_description_cache_invalidated_on_register(self):
+		"""Prompt descriptions are cached per URL and rebuilt after a new action is registered"""
+		registry = Registry()
+
+		@registry.action('Only on example pages', domains=['*.example.com'])
+		async def first_action(text: str):
+			return ActionResult()
+
+		description = registry.get_prompt_description('https://www.example.com/page')
+		assert 'first_action' in description
+		assert registry.get_prompt_description('https://www.example.com/page') is description
+
+		@registry.action('Also on example pages', domains=['*.example.com'])
+		async def second_action(text: str):
+			return ActionResult()
+
+		description = registry.get_prompt_description('https://www.example.com/page')
+		assert 'first_action' in description
+		assert 'second_action' in description
+
 	def test_extract_content_pattern_registration(self):
 		"""Test that the extract_content pattern with mixed params registers correctly"""
 		registry = Registry()
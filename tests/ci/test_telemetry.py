@@ -284,3 +284,19 @@ def test_telemetry_device_id_uses_config_dir():
 	# Verify it's not using the cache directory path
 	assert 'cache' not in telemetry.USER_ID_PATH
 	assert 'telemetry_user_id' not in telemetry.USER_ID_PATH
+
+
+def test_telemetry_capture_nowait_is_delivered_on_flush(monkeypatch, reset_telemetry_singleton):
+	"""Queued events should reach PostHog from the background thread before flush returns."""
+	monkeypatch.setenv('ANONYMIZED_TELEMETRY', 'false')
+
+	mock_client = MagicMock()
+	telemetry = ProductTelemetry()
+	telemetry._posthog_client = mock_client
+
+	telemetry.capture_nowait(CLITelemetryEvent(version='1.0.0', action='start', mode='oneshot'))
+	telemetry.flush()
+
+	mock_client.capture.assert_called_once()
+	assert mock_client.capture.call_args[1]['event'] == 'cli_event'
+	mock_client.flush.assert_called_once()
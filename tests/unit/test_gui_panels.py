@@ -1,8 +1,14 @@
 from __future__ import annotations
 
-from PySide6 import QtCore, QtWidgets
+import base64
+import logging
+import time
 
-from browser_use.gui.widgets import HistoryTab, StepInfoPanel, TaskHistoryEntry
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from browser_use.gui.widgets import ApprovalDialog, HistoryTab, LogTabsPanel, StepInfoPanel, TaskHistoryEntry
+from browser_use.gui.widgets.approval_dialog import _load_screenshot_pixmap
+from browser_use.gui.worker import QtLogFormatter, QtLogHandler
 
 
 def _ensure_qapp() -> QtWidgets.QApplication:
@@ -40,12 +46,37 @@ def test_step_info_panel_updates_snapshot() -> None:
 	assert panel.evaluation_edit.toPlainText() == '評価OK'
 
 
+def test_step_info_panel_only_resets_changed_fields() -> None:
+	_ensure_qapp()
+	panel = StepInfoPanel()
+
+	snapshot = {'step_number': 1, 'max_steps': 5, 'memory': '同じ', 'thinking': '一回目', 'next_goal': 'A'}
+	panel.update_snapshot(snapshot)
+	# 変化していないフィールドは再設定されないので、この値が残る
+	panel.memory_edit.setPlainText('sentinel')
+
+	panel.update_snapshot({**snapshot, 'step_number': 2, 'thinking': '二回目'})
+
+	assert panel.memory_edit.toPlainText() == 'sentinel'
+	assert panel.thinking_edit.toPlainText() == '二回目'
+	assert panel.step_label.text() == '2/5'
+
+	panel.clear()
+	assert panel.next_goal_label.text() == 'タスク実行待機中...'
+	assert panel.actions_list.count() == 0
+	assert panel.memory_edit.toPlainText() == ''
+
+	panel.update_snapshot(snapshot)
+	assert panel.memory_edit.toPlainText() == '同じ'
+	assert panel.actions_list.item(0).text() == '待機中...'
+
+
 def test_history_tab_detail_panel_renders_entry() -> None:
 	_ensure_qapp()
 	tab = HistoryTab()
 
-	start = QtCore.QDateTime.currentDateTime()
-	finished = start.addSecs(125)
+	start = time.time()
+	finished = start + 125
 	entry = TaskHistoryEntry(
 		task='GitHubでissue #1を調査する',
 		status='完了',
@@ -60,3 +91,137 @@ def test_history_tab_detail_panel_renders_entry() -> None:
 	assert '調査完了、修正不要でした。' == tab.detail_panel.result_label.text()
 	assert tab.detail_panel.finished_label.text() != '—'
 	assert tab.detail_panel.duration_label.text() == '2分5秒'
+
+
+def test_history_list_updates_rows_in_place() -> None:
+	_ensure_qapp()
+	tab = HistoryTab()
+	history = tab.history_list
+
+	first = TaskHistoryEntry(task='最初のタスク', status='完了')
+	second = TaskHistoryEntry(task='x' * 60, status='実行中')
+	history.insert_entry(0, first)
+	history.insert_entry(0, second)
+	kept_item = history.list_widget.item(1)
+
+	second.status = '失敗'
+	history.update_entry(0, second)
+
+	assert history.list_widget.count() == 2
+	assert history.current_row() == 0
+	assert history.list_widget.item(0).text().startswith('[失敗] ')
+	assert history.list_widget.item(0).text().endswith('x' * 47 + '...')
+	assert history.list_widget.item(1) is kept_item
+
+
+def _encode_png(width: int, height: int) -> str:
+	image = QtGui.QImage(width, height, QtGui.QImage.Format.Format_RGB32)
+	image.fill(QtGui.QColor('white'))
+	buffer = QtCore.QBuffer()
+	buffer.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
+	image.save(buffer, 'PNG')
+	return base64.b64encode(bytes(buffer.data().data())).decode()
+
+
+def test_approval_dialog_reuses_decoded_screenshot_on_retry() -> None:
+	_ensure_qapp()
+	_load_screenshot_pixmap.cache_clear()
+	payload = {'screenshot': _encode_png(1280, 720), 'actions': ['クリック']}
+
+	first = ApprovalDialog(payload)
+	second = ApprovalDialog(dict(payload))
+
+	assert _load_screenshot_pixmap.cache_info().hits == 1
+	assert first._image_label.pixmap().width() == 640
+	assert second._image_label.pixmap().width() == 640
+
+
+def test_approval_dialog_reset_clears_previous_request() -> None:
+	_ensure_qapp()
+	dialog = ApprovalDialog({'actions': ['クリック', 'テキスト入力'], 'thinking': '考え中', 'next_goal': 'A'})
+	# 再考用フィードバックを開いた状態で承認された後を再現する
+	dialog._feedback_section.setVisible(True)
+	dialog._retry_button.setText('再考（送信）')
+	dialog._feedback_edit.setPlainText('別のボタンを押して')
+	dialog._on_approve()
+	assert dialog.decision == 'approve'
+
+	dialog.reset({'actions': ['完了'], 'next_goal': 'B'})
+
+	assert dialog.decision == 'cancel'
+	assert dialog.feedback is None
+	assert dialog._actions_list.count() == 1
+	assert dialog._actions_list.item(0).text() == '完了'
+	assert dialog._feedback_edit.toPlainText() == ''
+	assert not dialog._feedback_section.isVisibleTo(dialog)
+	assert dialog._retry_button.text() == '🔄 再考'
+	assert not dialog._thinking_toggle.isEnabled()
+	assert 'B' in dialog._info_label.text()
+
+
+def test_log_tabs_route_messages_by_tag() -> None:
+	_ensure_qapp()
+	panel = LogTabsPanel()
+
+	panel.append_messages(['plain line', 'x - [Event] dispatched', 'x - [cdp] Page.navigate', '[CDP] [EVENT] both'])
+
+	assert panel.main_log.toPlainText() == 'plain line'
+	assert panel.event_log.toPlainText() == 'x - [Event] dispatched\n[CDP] [EVENT] both'
+	assert panel.cdp_log.toPlainText() == 'x - [cdp] Page.navigate'
+
+
+def test_log_handler_buffers_records_until_drained() -> None:
+	_ensure_qapp()
+	handler = QtLogHandler()
+	logger = logging.getLogger('test_gui_panels.log_handler')
+	logger.propagate = False
+	logger.addHandler(handler)
+	try:
+		logger.warning('first')
+		logger.warning('[EVENT] second')
+	finally:
+		logger.removeHandler(handler)
+
+	messages = handler.drain()
+	assert messages == ['first', '[EVENT] second']
+	assert handler.drain() == []
+
+	panel = LogTabsPanel()
+	panel.append_messages(messages)
+	assert panel.main_log.toPlainText() == 'first'
+	assert panel.event_log.toPlainText() == '[EVENT] second'
+
+
+def test_log_handler_drops_quiet_library_records() -> None:
+	handler = QtLogHandler()
+
+	def record(name: str, level: int) -> logging.LogRecord:
+		return logging.LogRecord(name, level, __file__, 0, f'{name} {logging.getLevelName(level)}', None, None)
+
+	handler.handle(record('httpx', logging.INFO))
+	handler.handle(record('httpcore.connection', logging.DEBUG))
+	handler.handle(record('httpx', logging.WARNING))
+	handler.handle(record('browser_use.agent', logging.INFO))
+	assert handler.drain() == ['httpx WARNING', 'browser_use.agent INFO']
+
+	handler.set_quiet_loggers({'browser_use'})
+	handler.handle(record('browser_use.agent', logging.INFO))
+	handler.handle(record('httpx', logging.INFO))
+	assert handler.drain() == ['httpx INFO']
+
+
+def test_log_formatter_matches_standard_timestamps() -> None:
+	fmt = '%(asctime)s - %(levelname)s - %(message)s'
+	formatter = QtLogFormatter(fmt)
+	reference = logging.Formatter(fmt)
+
+	for created in (1_700_000_000.25, 1_700_000_000.75, 1_700_000_001.5):
+		record = logging.makeLogRecord({'msg': 'hello %s', 'args': ('world',), 'levelname': 'INFO', 'created': created})
+		record.msecs = (created - int(created)) * 1000
+		assert formatter.format(record) == reference.format(record)
+
+	# msec 書式を外した場合も標準の Formatter と同じく秒単位の時刻だけを返す
+	formatter.default_msec_format = None
+	reference.default_msec_format = None
+	record = logging.makeLogRecord({'msg': 'bye', 'levelname': 'INFO', 'created': 1_700_000_002.5})
+	assert formatter.format(record) == reference.format(record)
@@ -217,6 +217,59 @@ async def test_multi_act_stops_on_done_action(test_logger, dummy_action_model_cl
 	agent._check_stop_or_pause.assert_awaited()
 
 
+@pytest.mark.asyncio
+async def test_multi_act_skips_dom_snapshot_after_read_only_action(test_logger, dummy_action_model_class):
+	agent = build_agent(test_logger)
+	agent.tools.registry.registry.actions = {'extract': SimpleNamespace(mutates_dom=False)}
+	agent.tools.act = AsyncMock(return_value=ActionResult(extracted_content='ok'))
+	executor = StepExecutor(agent)
+
+	actions = [
+		dummy_action_model_class(extract={'query': 'prices'}),
+		dummy_action_model_class(click={'selector': '#buy'}, index=3),
+	]
+	results = await executor.multi_act(actions)
+
+	assert len(results) == 2
+	agent.browser_session.get_browser_state_summary.assert_not_awaited()
+
+	actions = [
+		dummy_action_model_class(click={'selector': '#open'}),
+		dummy_action_model_class(click={'selector': '#buy'}, index=3),
+	]
+	await executor.multi_act(actions)
+
+	agent.browser_session.get_browser_state_summary.assert_awaited_once()
+
+
+def test_warmup_primes_prompt_descriptions(test_logger):
+	agent = build_agent(test_logger)
+	agent.initial_url = 'http://example.com/start'
+	executor = StepExecutor(cast(Any, agent))
+
+	executor.warmup()
+
+	primed_urls = {call.args[0] for call in agent.tools.registry.get_prompt_description.call_args_list}
+	assert primed_urls == {'about:blank', 'http://example.com/start'}
+
+
+@pytest.mark.asyncio
+async def test_finalize_skips_step_event_without_subscribers(test_logger, dummy_action_model_class):
+	agent = build_agent(test_logger)
+	agent.enable_cloud_sync = True
+	agent.eventbus = SimpleNamespace(handlers={}, dispatch=MagicMock())
+	agent.state.last_model_output = SimpleNamespace(action=[dummy_action_model_class(click={'selector': '#a'})])
+	agent.state.last_result = [ActionResult(extracted_content='ok')]
+	agent.step_start_time = 0.0
+	executor = StepExecutor(cast(Any, agent))
+
+	await executor.finalize(make_browser_state())
+
+	agent.eventbus.dispatch.assert_not_called()
+	agent.eventbus.handlers['*'] = [MagicMock()]
+	assert executor._has_step_event_subscribers()
+
+
 @pytest.mark.asyncio
 async def test_execute_step_handles_model_provider_error(test_logger):
 	agent = build_agent(test_logger)
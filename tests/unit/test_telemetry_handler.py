@@ -7,12 +7,13 @@ from unittest.mock import MagicMock
 import pytest
 
 from browser_use.agent.telemetry import TelemetryHandler
-from browser_use.agent.views import ActionResult
+from browser_use.agent.views import ActionResult, AgentHistory
 
 
 def make_agent_for_telemetry():
 	history_item = SimpleNamespace(
 		model_output=SimpleNamespace(action=[SimpleNamespace(model_dump=lambda exclude_unset=True: {'navigate': {'url': 'http://example.com'}})]),
+		action_dumps=lambda: [{'navigate': {'url': 'http://example.com'}}],
 		result=[ActionResult(extracted_content='ok')],
 		state=SimpleNamespace(url='http://example.com', title='Example'),
 		metadata=SimpleNamespace(step_number=1),
@@ -41,7 +42,7 @@ def make_agent_for_telemetry():
 		max_actions_per_step=5,
 		use_vision=True,
 	)
-	agent.browser_session = SimpleNamespace(cdp_url=None)
+	agent.browser_session = SimpleNamespace(cdp_url=None, cdp_hostname=None)
 	agent.state = SimpleNamespace(n_steps=1)
 	agent.token_cost_service = SimpleNamespace(
 		get_usage_tokens_for_model=lambda model: SimpleNamespace(prompt_tokens=10)
@@ -65,8 +66,26 @@ def test_log_agent_event_captures_payload():
 
 	handler.log_agent_event(max_steps=5, agent_run_error=None)
 
-	assert agent.telemetry.capture.called
-	event = agent.telemetry.capture.call_args.args[0]
+	assert agent.telemetry.capture_nowait.called
+	event = agent.telemetry.capture_nowait.call_args.args[0]
 	payload = event.__dict__
 	assert payload['model'] == 'mock-model'
 	assert payload['steps'] == 1
+
+
+def test_history_item_dumps_actions_once():
+	action = MagicMock()
+	action.model_dump.return_value = {'navigate': {'url': 'http://example.com'}}
+	item = AgentHistory.model_construct(model_output=SimpleNamespace(action=[action]), result=[], state=None)
+
+	assert item.action_dumps() == [{'navigate': {'url': 'http://example.com'}}]
+	assert item.action_dumps() is item.action_dumps()
+	action.model_dump.assert_called_once_with(exclude_unset=True)
+
+	agent = make_agent_for_telemetry()
+	agent.history.history = [item]
+	TelemetryHandler(agent).log_agent_event(max_steps=5)
+
+	event = agent.telemetry.capture_nowait.call_args.args[0]
+	assert event.action_history == [[{'navigate': {'url': 'http://example.com'}}]]
+	action.model_dump.assert_called_once()